@@ -15,6 +15,15 @@ SIMPLEST METHOD: Just copy a network request as cURL!
 import re
 from typing import Optional, Dict
 
+# Query parameters in the request URL: ?user_id=123&connection_id=abc&api_key=xyz
+# (stops at any trailing quote or apostrophe)
+_USER_ID_RE = re.compile(r'[?&]user_id=([^&\s\'\"]+)')
+_CONNECTION_ID_RE = re.compile(r'[?&]connection_id=([^&\s\'\"]+)')
+_API_KEY_RE = re.compile(r'[?&]api_key=([^&\s\'\"]+)')
+
+# Authorization header: -H 'authorization: eyJhbGci...'
+_AUTH_RE = re.compile(r"-H ['\"]authorization:\s*([^'\"]+)['\"]", re.IGNORECASE)
+
 
 def extract_config_from_curl(curl_command: str) -> Optional[Dict[str, str]]:
     """
@@ -33,11 +42,9 @@ def extract_config_from_curl(curl_command: str) -> Optional[Dict[str, str]]:
     config = {}
 
     # Extract from URL query parameters
-    # Pattern: ?user_id=123&connection_id=abc&api_key=xyz
-    # Remove any trailing quotes or apostrophes
-    user_id_match = re.search(r'[?&]user_id=([^&\s\'\"]+)', curl_command)
-    connection_id_match = re.search(r'[?&]connection_id=([^&\s\'\"]+)', curl_command)
-    api_key_match = re.search(r'[?&]api_key=([^&\s\'\"]+)', curl_command)
+    user_id_match = _USER_ID_RE.search(curl_command)
+    connection_id_match = _CONNECTION_ID_RE.search(curl_command)
+    api_key_match = _API_KEY_RE.search(curl_command)
 
     if user_id_match:
         config['user_id'] = user_id_match.group(1).strip('\'"')
@@ -61,8 +68,7 @@ def extract_config_from_curl(curl_command: str) -> Optional[Dict[str, str]]:
         config['api_key'] = "ezwwjrd7jqah"
 
     # Extract authorization token from header
-    # Pattern: -H 'authorization: eyJhbGci...'
-    auth_match = re.search(r"-H ['\"]authorization:\s*([^'\"]+)['\"]", curl_command, re.IGNORECASE)
+    auth_match = _AUTH_RE.search(curl_command)
     if auth_match:
         config['auth_token'] = auth_match.group(1).strip()
         print(f"  [OK] Found auth_token: {config['auth_token'][:50]}...")
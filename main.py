@@ -3,6 +3,9 @@ Main entry point for the Patreon Channel Search tool.
 This is a simple demonstration of fetching and displaying channels.
 """
 
+import io
+import sys
+
 from dotenv import load_dotenv
 from src.config import StreamAPIConfig
 from src.clients import StreamChatClient
@@ -26,22 +29,30 @@ def main():
             print("\nResponse received successfully!")
             print(f"Number of channels: {len(channels_data.get('channels', []))}")
 
-            # Display channel details
+            # Display channel details, buffered and written out in one go
+            buf = io.StringIO()
             for idx, channel_wrapper in enumerate(channels_data.get('channels', []), 1):
                 # The actual channel data is nested inside a 'channel' key
                 channel = channel_wrapper.get('channel', {})
-
-                print(f"\nChannel {idx}:")
-                print(f"  Name: {channel.get('name', 'N/A')}")
-                print(f"  Type: {channel.get('type')}")
-                print(f"  ID: {channel.get('id')}")
-                print(f"  CID: {channel.get('cid')}")
-                print(f"  Member count: {channel.get('member_count', 'N/A')}")
-                print(f"  Campaign ID: {channel.get('campaign_id', 'N/A')}")
+                get = channel.get
+
+                lines = [
+                    f"\nChannel {idx}:",
+                    f"  Name: {get('name', 'N/A')}",
+                    f"  Type: {get('type')}",
+                    f"  ID: {get('id')}",
+                    f"  CID: {get('cid')}",
+                    f"  Member count: {get('member_count', 'N/A')}",
+                    f"  Campaign ID: {get('campaign_id', 'N/A')}",
+                ]
                 if 'last_message_at' in channel:
-                    print(f"  Last message: {channel['last_message_at']}")
+                    lines.append(f"  Last message: {channel['last_message_at']}")
                 if 'emoji' in channel:
-                    print(f"  Emoji: {channel['emoji']}")
+                    lines.append(f"  Emoji: {channel['emoji']}")
+                buf.write("\n".join(lines))
+                buf.write("\n")
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
 
         except Exception as e:
             print(f"Failed to fetch channels: {e}")
@@ -3,12 +3,19 @@ Stream.io API Client
 Handles all API communication with Stream.io chat API.
 """
 
+import orjson
 import requests
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING
 if TYPE_CHECKING:
     from ..config.api_config import StreamAPIConfig
 
 
+# Most channels Stream returns for one query (the maximum "limit")
+_MAX_CHANNELS_PER_QUERY = 30
+
+
 class StreamChatClient:
     """Client for interacting with Stream.io Chat API."""
 
@@ -21,7 +28,26 @@ class StreamChatClient:
         """
         self.config: "StreamAPIConfig" = config
         self.session: requests.Session = requests.Session()
+        self._setup_connection_pool()
         self._setup_headers()
+        # Credentials don't change after construction, so the query parameters are built once
+        self._params: Dict[str, str] = self._build_query_params()
+        self._query_prefixes: Dict[Tuple[int, bool, bool], bytes] = {}
+
+    def _setup_connection_pool(self) -> None:
+        """Mount an adapter that pools keep-alive connections and retries transient failures."""
+        # Rate limits and 5xx errors are usually transient; retrying here keeps a long
+        # pagination run from losing every page it already fetched
+        retries = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["POST"],
+            respect_retry_after_header=True,
+        )
+        # Every request goes to the same host, so a single large pool is reused across calls
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=40, max_retries=retries)
+        self.session.mount("https://", adapter)
 
     def _setup_headers(self) -> None:
         """Configure session headers for API requests."""
@@ -46,13 +72,42 @@ class StreamChatClient:
         # Remove None values
         return {k: v for k, v in params.items() if v is not None}
 
+    def _query_payload_prefix(self, message_limit: int, state: bool, minimal: bool) -> bytes:
+        """
+        Get the serialized query_channel payload up to the message pagination cursors.
+
+        Paginating a channel sends the same payload over and over with only the
+        cursor changing, so the constant part is serialized once and reused.
+        The returned bytes leave the "messages" object (the last key) open.
+
+        Args:
+            message_limit: Maximum number of messages to return
+            state: Include channel state
+            minimal: Omit the channel data field
+
+        Returns:
+            Serialized payload prefix
+        """
+        key = (message_limit, state, minimal)
+        prefix = self._query_prefixes.get(key)
+        if prefix is None:
+            payload: Dict[str, Any] = {"state": state}
+            if not minimal:
+                payload["data"] = {}
+            payload["messages"] = {"limit": message_limit}
+            # Drop the closing braces of "messages" and the payload so cursors can be appended
+            prefix = orjson.dumps(payload)[:-2]
+            self._query_prefixes[key] = prefix
+        return prefix
+
     def query_channel(
         self,
         channel_id: str,
         message_limit: int = 100,
         id_lt: Optional[str] = None,
         id_gt: Optional[str] = None,
-        state: bool = True
+        state: bool = True,
+        minimal: bool = False
     ) -> Dict[str, Any]:
         """
         Query a channel with message pagination support.
@@ -62,7 +117,9 @@ class StreamChatClient:
             message_limit: Maximum number of messages to return (default: 100)
             id_lt: Fetch messages with ID less than this (for fetching older messages)
             id_gt: Fetch messages with ID greater than this (for fetching newer messages)
-            state: Include channel state (default: True)
+            state: Include channel state (default: True). Messages are returned as part
+                of the channel state, so this must stay on when paginating messages.
+            minimal: Send only the fields needed to page through messages (default: False)
 
         Returns:
             JSON response from the API containing channel and messages
@@ -80,33 +137,17 @@ class StreamChatClient:
         # Build the URL
         url = f"{self.config.base_url}/channels/{channel_type}/{channel_uuid}/query"
 
-        # Build query parameters
-        params = self._build_query_params()
-
-        # Build the request payload
-        payload = {
-            "data": {},
-            "state": state,
-            "messages": {
-                "limit": message_limit
-            }
-        }
-
-        # Add pagination parameters if provided
+        # Build the request payload: a cached prefix plus the pagination cursors
+        body = self._query_payload_prefix(message_limit, state, minimal)
         if id_lt:
-            payload["messages"]["id_lt"] = id_lt
+            body += b',"id_lt":' + orjson.dumps(id_lt)
         if id_gt:
-            payload["messages"]["id_gt"] = id_gt
-
-        try:
-            response = self.session.post(url, params=params, json=payload)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error querying channel: {e}")
-            if hasattr(e.response, 'text'):
-                print(f"Response: {e.response.text}")
-            raise
+            body += b',"id_gt":' + orjson.dumps(id_gt)
+        body += b"}}"
+
+        response = self.session.post(url, params=self._params, data=body, timeout=self.config.timeout)
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     def get_channel_by_id(
         self,
@@ -155,18 +196,95 @@ class StreamChatClient:
             "limit": message_limit
         }
 
-        # Build query parameters
-        params = self._build_query_params()
+        response = self.session.post(url, params=self._params, data=orjson.dumps(payload), timeout=self.config.timeout)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def get_channels_by_cids(
+        self,
+        channel_ids: List[str],
+        messages_per_channel: Optional[int] = None,
+        state: bool = True,
+        watch: bool = False,
+        presence: bool = False,
+        sort_field: str = "last_message_at",
+        sort_direction: int = -1,
+    ) -> Dict[str, Any]:
+        """
+        Fetch several channels by CID.
+
+        An opt-in helper for callers that want metadata for many channels up
+        front; nothing calls it implicitly. Stream returns at most 30 channels
+        per query, so the CIDs are sent in batches of up to 30 and the
+        channels of every batch are combined. Unlike get_channel_by_id it does
+        not watch the channels by default, so a metadata lookup does not
+        subscribe to every channel.
+
+        Args:
+            channel_ids: The channel IDs (CIDs) to fetch
+            messages_per_channel: Maximum number of messages per channel (default: Stream's default)
+            state: Include channel state (default: True)
+            watch: Watch for changes (default: False)
+            presence: Include presence information (default: False)
+            sort_field: Field to sort messages by (default: "last_message_at")
+            sort_direction: Sort direction, -1 for descending, 1 for ascending (default: -1)
+
+        Returns:
+            JSON response from the API containing channel data (the
+            "channels" of all batches)
+
+        Raises:
+            requests.exceptions.RequestException: If an API request fails
+        """
+        url = f"{self.config.base_url}/channels"
+        channel_ids = list(channel_ids)
+        result: Dict[str, Any] = {"channels": []}
+
+        for start in range(0, len(channel_ids), _MAX_CHANNELS_PER_QUERY):
+            batch = channel_ids[start:start + _MAX_CHANNELS_PER_QUERY]
+            data = self._query_channels_by_cids(
+                url, batch, messages_per_channel, state, watch, presence, sort_field, sort_direction
+            )
+            if start == 0:
+                result = data
+            else:
+                result.setdefault("channels", []).extend(data.get("channels", []))
+        return result
+
+    def _query_channels_by_cids(
+        self,
+        url: str,
+        channel_ids: List[str],
+        messages_per_channel: Optional[int],
+        state: bool,
+        watch: bool,
+        presence: bool,
+        sort_field: str,
+        sort_direction: int,
+    ) -> Dict[str, Any]:
+        """Send one channels query for at most _MAX_CHANNELS_PER_QUERY CIDs (see get_channels_by_cids)."""
+        payload = {
+            "filter_conditions": {
+                "cid": {"$in": channel_ids}
+            },
+            "sort": [
+                {
+                    "field": sort_field,
+                    "direction": sort_direction
+                }
+            ],
+            "state": state,
+            "watch": watch,
+            "presence": presence,
+            # "limit" caps how many channels come back, so it covers the whole batch
+            "limit": len(channel_ids)
+        }
+        if messages_per_channel is not None:
+            payload["message_limit"] = messages_per_channel
 
-        try:
-            response = self.session.post(url, params=params, json=payload)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching channel: {e}")
-            if hasattr(e.response, 'text'):
-                print(f"Response: {e.response.text}")
-            raise
+        response = self.session.post(url, params=self._params, data=orjson.dumps(payload), timeout=self.config.timeout)
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     def get_channels(
         self,
@@ -228,18 +346,9 @@ class StreamChatClient:
             "offset": offset
         }
 
-        # Build query parameters
-        params = self._build_query_params()
-
-        try:
-            response = self.session.post(url, params=params, json=payload)
-            response.raise_for_status()  # Raise exception for bad status codes
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching channels: {e}")
-            if hasattr(e.response, 'text'):
-                print(f"Response: {e.response.text}")
-            raise
+        response = self.session.post(url, params=self._params, data=orjson.dumps(payload), timeout=self.config.timeout)
+        response.raise_for_status()  # Raise exception for bad status codes
+        return orjson.loads(response.content)
 
     def close(self) -> None:
         """Close the session."""
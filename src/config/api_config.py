@@ -8,18 +8,25 @@ from typing import Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class StreamAPIConfig:
-    """Configuration for Stream.io API client."""
+    """
+    Configuration for Stream.io API client.
+
+    Instances are immutable once constructed, so a single config can be shared
+    between clients and threads without copying.
+    """
     base_url: str = "https://chat.stream-io-api.com"
     api_key: Optional[str] = None
     user_id: Optional[str] = None
     connection_id: Optional[str] = None
     authorization_token: Optional[str] = None
+    timeout: float = 30.0  # Seconds to wait for the API before giving up on a request
 
     def __post_init__(self) -> None:
         """Load configuration from environment variables if not provided."""
-        self.api_key = self.api_key or os.getenv("STREAM_API_KEY")
-        self.user_id = self.user_id or os.getenv("STREAM_USER_ID")
-        self.connection_id = self.connection_id or os.getenv("STREAM_CONNECTION_ID")
-        self.authorization_token = self.authorization_token or os.getenv("STREAM_AUTH_TOKEN")
+        # The dataclass is frozen, so fields have to be set through object.__setattr__
+        object.__setattr__(self, "api_key", self.api_key or os.getenv("STREAM_API_KEY"))
+        object.__setattr__(self, "user_id", self.user_id or os.getenv("STREAM_USER_ID"))
+        object.__setattr__(self, "connection_id", self.connection_id or os.getenv("STREAM_CONNECTION_ID"))
+        object.__setattr__(self, "authorization_token", self.authorization_token or os.getenv("STREAM_AUTH_TOKEN"))
@@ -1,13 +1,26 @@
 """Core functionality module."""
 
-from .search import MessageSearcher, SearchResult, search_channels_interactive
-from .pagination import ChannelPaginator, MultiChannelPaginator, PaginationState
-from .interactive_cli import InteractiveCLI, start_interactive_cli
-from .renderers import DisplayConfig
-from .view_context import ViewContext, ViewMode
-from .navigation import NavigationController
-from .command_parser import CommandParser
-from .logger import get_logger
+import importlib
+from typing import Any, List
+
+# Public names and the submodules that define them. Submodules are imported on
+# first access, so importing one piece of the package doesn't load the rest.
+_LAZY_ATTRS = {
+    'MessageSearcher': '.search',
+    'SearchResult': '.search',
+    'search_channels_interactive': '.search',
+    'ChannelPaginator': '.pagination',
+    'MultiChannelPaginator': '.pagination',
+    'PaginationState': '.pagination',
+    'InteractiveCLI': '.interactive_cli',
+    'start_interactive_cli': '.interactive_cli',
+    'DisplayConfig': '.renderers',
+    'ViewContext': '.view_context',
+    'ViewMode': '.view_context',
+    'NavigationController': '.navigation',
+    'CommandParser': '.command_parser',
+    'get_logger': '.logger',
+}
 
 __all__ = [
     'MessageSearcher',
@@ -25,3 +38,19 @@ __all__ = [
     'CommandParser',
     'get_logger'
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining a public name on first access (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the public names, including those not imported yet."""
+    return sorted(set(globals()) | set(__all__))
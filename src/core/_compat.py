@@ -0,0 +1,8 @@
+"""
+Compatibility shims for differences between supported Python versions.
+"""
+
+import sys
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
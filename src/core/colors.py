@@ -2,127 +2,273 @@
 Terminal color utilities using colorama for cross-platform support.
 """
 
-from colorama import Fore, Back, Style, init
-from typing import Optional
+import sys
+from functools import lru_cache
+from colorama import Fore, Back, Style, just_fix_windows_console
+from typing import List, Optional
 
-# Initialize colorama for Windows support
-init(autoreset=True)
+# Colors are only emitted to a terminal; decided once, at import
+_ENABLED = sys.stdout is not None and sys.stdout.isatty()
+
+# Every helper emits its own reset, so colorama only has to translate escape
+# sequences on legacy Windows consoles. Redirected output never receives
+# escape sequences (see _code), so stdout and stderr are never wrapped in
+# colorama's per-write stripping writer
+if _ENABLED:
+    just_fix_windows_console()
+
+
+def _code(sequence: str) -> str:
+    """Return an escape sequence, or an empty string when colors are disabled."""
+    return sequence if _ENABLED else ""
+
+
+# Escape sequences used by the Colors helpers, combined once at import time;
+# all empty when output is redirected, so no escape bytes are built at all
+_BOLD = _code(Style.BRIGHT)
+_RESET = _code(Style.RESET_ALL)
+_SUCCESS = _code(Fore.GREEN)
+_SUCCESS_BOLD = _code(Style.BRIGHT + Fore.GREEN)
+_ERROR = _code(Fore.RED)
+_ERROR_BOLD = _code(Style.BRIGHT + Fore.RED)
+_WARNING = _code(Fore.YELLOW)
+_WARNING_BOLD = _code(Style.BRIGHT + Fore.YELLOW)
+_INFO = _code(Fore.CYAN)
+_INFO_BOLD = _code(Style.BRIGHT + Fore.CYAN)
+_HIGHLIGHT = _code(Fore.LIGHTYELLOW_EX)
+_HIGHLIGHT_BOLD = _code(Style.BRIGHT + Fore.LIGHTYELLOW_EX)
+_MUTED = _code(Style.DIM)
+_HEADER = _code(Style.BRIGHT + Fore.LIGHTCYAN_EX)
+_COMMAND = _code(Fore.MAGENTA)
+_VALUE = _code(Fore.LIGHTWHITE_EX)
+_USERNAME = _code(Style.BRIGHT + Fore.LIGHTBLUE_EX)
+_CHANNEL = _code(Style.BRIGHT + Fore.LIGHTGREEN_EX)
+
+# The helpers below format with f-strings rather than "+": on CPython 3.11 an
+# f-string builds the result in a single allocation and is faster than two
+# concatenations (or str.join), and it also accepts non-str values.
+
+
+def colorize(text: str, color: str, bold: bool = False) -> str:
+    """
+    Colorize text with the specified color.
+
+    Args:
+        text: Text to colorize
+        color: Color code
+        bold: Whether to make text bold
+
+    Returns:
+        Colored text string
+    """
+    if not _ENABLED:
+        return f"{text}"
+    prefix = _BOLD + color if bold else color
+    return f"{prefix}{text}{_RESET}"
+
+
+def success(text: str, bold: bool = False) -> str:
+    """Green text for success messages."""
+    return f"{_SUCCESS_BOLD if bold else _SUCCESS}{text}{_RESET}"
+
+
+def error(text: str, bold: bool = True) -> str:
+    """Red text for error messages."""
+    return f"{_ERROR_BOLD if bold else _ERROR}{text}{_RESET}"
+
+
+def warning(text: str, bold: bool = False) -> str:
+    """Yellow text for warning messages."""
+    return f"{_WARNING_BOLD if bold else _WARNING}{text}{_RESET}"
+
+
+def info(text: str, bold: bool = False) -> str:
+    """Cyan text for info messages."""
+    return f"{_INFO_BOLD if bold else _INFO}{text}{_RESET}"
+
+
+def highlight(text: str, bold: bool = True) -> str:
+    """Bright yellow text for highlighting."""
+    return f"{_HIGHLIGHT_BOLD if bold else _HIGHLIGHT}{text}{_RESET}"
+
+
+def muted(text: str) -> str:
+    """Dimmed text for less important info."""
+    return f"{_MUTED}{text}{_RESET}"
+
+
+def header(text: str) -> str:
+    """Bright cyan bold text for headers."""
+    return f"{_HEADER}{text}{_RESET}"
+
+
+def command(text: str) -> str:
+    """Magenta text for commands."""
+    return f"{_COMMAND}{text}{_RESET}"
+
+
+def value(text: str) -> str:
+    """Bright white text for values."""
+    return f"{_VALUE}{text}{_RESET}"
+
+
+def username(text: str) -> str:
+    """Blue text for usernames."""
+    return f"{_USERNAME}{text}{_RESET}"
+
+
+def channel(text: str) -> str:
+    """Bright green text for channel names."""
+    return f"{_CHANNEL}{text}{_RESET}"
+
+
+def date(text: str) -> str:
+    """Dimmed text for dates."""
+    return f"{_MUTED}{text}{_RESET}"
 
 
 class Colors:
     """Color codes and utility methods for terminal output."""
 
     # Foreground colors
-    BLACK = Fore.BLACK
-    RED = Fore.RED
-    GREEN = Fore.GREEN
-    YELLOW = Fore.YELLOW
-    BLUE = Fore.BLUE
-    MAGENTA = Fore.MAGENTA
-    CYAN = Fore.CYAN
-    WHITE = Fore.WHITE
+    BLACK = _code(Fore.BLACK)
+    RED = _code(Fore.RED)
+    GREEN = _code(Fore.GREEN)
+    YELLOW = _code(Fore.YELLOW)
+    BLUE = _code(Fore.BLUE)
+    MAGENTA = _code(Fore.MAGENTA)
+    CYAN = _code(Fore.CYAN)
+    WHITE = _code(Fore.WHITE)
 
     # Bright colors
-    BRIGHT_BLACK = Fore.LIGHTBLACK_EX
-    BRIGHT_RED = Fore.LIGHTRED_EX
-    BRIGHT_GREEN = Fore.LIGHTGREEN_EX
-    BRIGHT_YELLOW = Fore.LIGHTYELLOW_EX
-    BRIGHT_BLUE = Fore.LIGHTBLUE_EX
-    BRIGHT_MAGENTA = Fore.LIGHTMAGENTA_EX
-    BRIGHT_CYAN = Fore.LIGHTCYAN_EX
-    BRIGHT_WHITE = Fore.LIGHTWHITE_EX
+    BRIGHT_BLACK = _code(Fore.LIGHTBLACK_EX)
+    BRIGHT_RED = _code(Fore.LIGHTRED_EX)
+    BRIGHT_GREEN = _code(Fore.LIGHTGREEN_EX)
+    BRIGHT_YELLOW = _code(Fore.LIGHTYELLOW_EX)
+    BRIGHT_BLUE = _code(Fore.LIGHTBLUE_EX)
+    BRIGHT_MAGENTA = _code(Fore.LIGHTMAGENTA_EX)
+    BRIGHT_CYAN = _code(Fore.LIGHTCYAN_EX)
+    BRIGHT_WHITE = _code(Fore.LIGHTWHITE_EX)
 
     # Background colors
-    BG_BLACK = Back.BLACK
-    BG_RED = Back.RED
-    BG_GREEN = Back.GREEN
-    BG_YELLOW = Back.YELLOW
-    BG_BLUE = Back.BLUE
-    BG_MAGENTA = Back.MAGENTA
-    BG_CYAN = Back.CYAN
-    BG_WHITE = Back.WHITE
+    BG_BLACK = _code(Back.BLACK)
+    BG_RED = _code(Back.RED)
+    BG_GREEN = _code(Back.GREEN)
+    BG_YELLOW = _code(Back.YELLOW)
+    BG_BLUE = _code(Back.BLUE)
+    BG_MAGENTA = _code(Back.MAGENTA)
+    BG_CYAN = _code(Back.CYAN)
+    BG_WHITE = _code(Back.WHITE)
 
     # Styles
-    BOLD = Style.BRIGHT
-    DIM = Style.DIM
-    NORMAL = Style.NORMAL
-    RESET = Style.RESET_ALL
+    BOLD = _code(Style.BRIGHT)
+    DIM = _code(Style.DIM)
+    NORMAL = _code(Style.NORMAL)
+    RESET = _code(Style.RESET_ALL)
+
+    # The color helpers are module-level functions (hot paths can import them
+    # directly); these aliases keep the Colors.<name> spelling working
+    colorize = staticmethod(colorize)
+    success = staticmethod(success)
+    error = staticmethod(error)
+    warning = staticmethod(warning)
+    info = staticmethod(info)
+    highlight = staticmethod(highlight)
+    muted = staticmethod(muted)
+    header = staticmethod(header)
+    command = staticmethod(command)
+    value = staticmethod(value)
+    username = staticmethod(username)
+    channel = staticmethod(channel)
+    date = staticmethod(date)
+
+
+class StyledWriter:
+    """
+    Builds a line of colored text, emitting escape sequences only when the style changes.
+
+    Adjacent fragments that share a style are written under a single prefix,
+    and the line ends with a single reset. Whitespace keeps the current style,
+    since only foreground colors and intensity are used.
+    """
+
+    def __init__(self) -> None:
+        self._parts: List[str] = []
+        self._style: str = ""
 
-    @staticmethod
-    def colorize(text: str, color: str, bold: bool = False) -> str:
+    def write(self, text: str, color: str = "", bold: bool = False) -> "StyledWriter":
         """
-        Colorize text with the specified color.
+        Append text in the given style.
 
         Args:
-            text: Text to colorize
-            color: Color code
+            text: Text to append
+            color: Color or style code (default: no color)
             bold: Whether to make text bold
 
         Returns:
-            Colored text string
+            The writer itself, so calls can be chained
         """
-        style = Style.BRIGHT if bold else ""
-        return f"{style}{color}{text}{Style.RESET_ALL}"
-
-    @staticmethod
-    def success(text: str, bold: bool = False) -> str:
-        """Green text for success messages."""
-        return Colors.colorize(text, Fore.GREEN, bold)
-
-    @staticmethod
-    def error(text: str, bold: bool = True) -> str:
-        """Red text for error messages."""
-        return Colors.colorize(text, Fore.RED, bold)
-
-    @staticmethod
-    def warning(text: str, bold: bool = False) -> str:
-        """Yellow text for warning messages."""
-        return Colors.colorize(text, Fore.YELLOW, bold)
-
-    @staticmethod
-    def info(text: str, bold: bool = False) -> str:
-        """Cyan text for info messages."""
-        return Colors.colorize(text, Fore.CYAN, bold)
-
-    @staticmethod
-    def highlight(text: str, bold: bool = True) -> str:
-        """Bright yellow text for highlighting."""
-        return Colors.colorize(text, Fore.LIGHTYELLOW_EX, bold)
-
-    @staticmethod
-    def muted(text: str) -> str:
-        """Dimmed text for less important info."""
-        return f"{Style.DIM}{text}{Style.RESET_ALL}"
-
-    @staticmethod
-    def header(text: str) -> str:
-        """Bright cyan bold text for headers."""
-        return Colors.colorize(text, Fore.LIGHTCYAN_EX, bold=True)
-
-    @staticmethod
-    def command(text: str) -> str:
-        """Magenta text for commands."""
-        return Colors.colorize(text, Fore.MAGENTA, bold=False)
-
-    @staticmethod
-    def value(text: str) -> str:
-        """Bright white text for values."""
-        return Colors.colorize(text, Fore.LIGHTWHITE_EX, bold=False)
-
-    @staticmethod
-    def username(text: str) -> str:
-        """Blue text for usernames."""
-        return Colors.colorize(text, Fore.LIGHTBLUE_EX, bold=True)
-
-    @staticmethod
-    def channel(text: str) -> str:
-        """Bright green text for channel names."""
-        return Colors.colorize(text, Fore.LIGHTGREEN_EX, bold=True)
-
-    @staticmethod
-    def date(text: str) -> str:
-        """Dimmed text for dates."""
-        return Colors.muted(text)
+        text = str(text)
+        if not _ENABLED:
+            # Plain text only, even for raw escape codes such as Fore.* values
+            self._parts.append(text)
+            return self
+        style = _BOLD + color if bold else color
+        if style != self._style and text and not text.isspace():
+            if self._style:
+                self._parts.append(_RESET)
+            self._parts.append(style)
+            self._style = style
+        self._parts.append(text)
+        return self
+
+    def getvalue(self) -> str:
+        """Return the line written so far, terminated by a reset if it ends styled."""
+        line = "".join(self._parts)
+        return line + _RESET if self._style else line
+
+
+@lru_cache(maxsize=32)
+def _build_separator(char: str, length: int, color: str) -> str:
+    """Build a colored separator line, newline included (cached, since only a few variants are ever used)."""
+    return colorize(char * length, color) + "\n"
+
+
+@lru_cache(maxsize=64)
+def _build_header(text: str, char: str, length: int) -> str:
+    """Build a centered, colored header between two separators, newlines included."""
+    separator = _build_separator(char, length, Fore.CYAN)
+    return f"{separator}{header(text.center(length))}\n{separator}"
+
+
+def format_separator(char: str = "=", length: int = 80, color: Optional[str] = None) -> str:
+    """
+    Return a colored separator line, trailing newline included.
+
+    Args:
+        char: Character to use for separator
+        length: Length of separator
+        color: Color to use (default: cyan)
+
+    Returns:
+        Separator line, for callers that buffer their output
+    """
+    return _build_separator(char, length, color or Fore.CYAN)
+
+
+def format_header(text: str, char: str = "=", length: int = 80) -> str:
+    """
+    Return a colored header with separators, trailing newline included.
+
+    Args:
+        text: Header text
+        char: Character for separator
+        length: Length of separator
+
+    Returns:
+        Header block, for callers that buffer their output
+    """
+    return _build_header(text, char, length)
 
 
 def print_separator(char: str = "=", length: int = 80, color: Optional[str] = None) -> None:
@@ -134,11 +280,7 @@ def print_separator(char: str = "=", length: int = 80, color: Optional[str] = No
         length: Length of separator
         color: Color to use (default: cyan)
     """
-    separator = char * length
-    if color:
-        print(Colors.colorize(separator, color))
-    else:
-        print(Colors.colorize(separator, Fore.CYAN))
+    sys.stdout.write(_build_separator(char, length, color or Fore.CYAN))
 
 
 def print_header(text: str, char: str = "=", length: int = 80) -> None:
@@ -150,6 +292,4 @@ def print_header(text: str, char: str = "=", length: int = 80) -> None:
         char: Character for separator
         length: Length of separator
     """
-    print_separator(char, length, Fore.CYAN)
-    print(Colors.header(text.center(length)))
-    print_separator(char, length, Fore.CYAN)
+    sys.stdout.write(_build_header(text, char, length))
@@ -3,13 +3,16 @@ Command parsing utilities.
 Separates argument parsing logic from command execution.
 """
 
+from functools import lru_cache
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
 
+from ._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SearchOptions:
-    """Parsed search command options."""
+    """Parsed search command options (immutable, so parsed results can be shared)."""
     keyword: Optional[str] = None
     user: Optional[str] = None
     case_sensitive: bool = False
@@ -17,6 +20,25 @@ class SearchOptions:
     search_usernames: bool = True
 
 
+# Strings accepted as True by parse_bool_arg
+_TRUTHY = frozenset({'true', '1', 'yes', 'on'})
+
+# Actions accepted by the fields command
+_FIELD_ACTIONS = frozenset({'add', 'remove'})
+
+# Search flags without a value: flag -> (SearchOptions field, value it sets)
+_SEARCH_SWITCHES = {
+    '--case': ('case_sensitive', True),
+    '--text-only': ('search_usernames', False),
+    '--user-only': ('search_text', False),
+}
+
+# Search flags followed by a value: flag -> SearchOptions field
+_SEARCH_VALUE_FLAGS = {
+    '--user': 'user',
+}
+
+
 class CommandParser:
     """Parses command arguments following Single Responsibility Principle."""
 
@@ -36,11 +58,16 @@ class CommandParser:
         if not args:
             return default, None
 
+        arg = args[0]
+        # Plain digit strings are the common case and can't fail to parse
+        if arg.isdecimal():
+            return int(arg), None
+
         try:
-            value = int(args[0])
+            value = int(arg)
             return value, None
         except ValueError:
-            return default, f"Invalid {arg_name}: {args[0]}"
+            return default, f"Invalid {arg_name}: {arg}"
 
     @staticmethod
     def parse_bool_arg(value: str) -> bool:
@@ -53,54 +80,23 @@ class CommandParser:
         Returns:
             Boolean value
         """
-        return value.lower() in ['true', '1', 'yes', 'on']
+        return value.casefold() in _TRUTHY
 
     @staticmethod
     def parse_search_args(args: List[str]) -> Tuple[Optional[SearchOptions], Optional[str]]:
         """
         Parse search command arguments.
 
+        Results are cached by argument tuple, since the same searches tend to
+        be typed again during a session.
+
         Args:
             args: Argument list from search command
 
         Returns:
             Tuple of (SearchOptions_or_none, error_message_or_none)
         """
-        if not args:
-            return None, "No search query provided"
-
-        options = SearchOptions()
-        i = 0
-
-        while i < len(args):
-            arg = args[i]
-
-            if arg == '--user':
-                if i + 1 < len(args):
-                    options.user = args[i + 1]
-                    i += 2
-                else:
-                    return None, "--user requires a value"
-
-            elif arg == '--case':
-                options.case_sensitive = True
-                i += 1
-
-            elif arg == '--text-only':
-                options.search_usernames = False
-                i += 1
-
-            elif arg == '--user-only':
-                options.search_text = False
-                i += 1
-
-            else:
-                # Assume it's the keyword
-                if options.keyword is None:
-                    options.keyword = arg
-                i += 1
-
-        return options, None
+        return _parse_search_args(tuple(args))
 
     @staticmethod
     def parse_fields_args(args: List[str]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
@@ -119,13 +115,13 @@ class CommandParser:
         action = args[0].lower()
 
         if len(args) < 2:
-            if action in ['add', 'remove']:
+            if action in _FIELD_ACTIONS:
                 return None, None, f"Usage: fields <add|remove> <field>"
             return None, None, None
 
         field = args[1]
 
-        if action not in ['add', 'remove']:
+        if action not in _FIELD_ACTIONS:
             return None, None, f"Unknown action: {action}. Use 'add' or 'remove'"
 
         return action, field, None
@@ -145,3 +141,34 @@ class CommandParser:
             return None, None, "Usage: set <key> <value>"
 
         return args[0], args[1], None
+
+
+@lru_cache(maxsize=128)
+def _parse_search_args(args: Tuple[str, ...]) -> Tuple[Optional[SearchOptions], Optional[str]]:
+    """Parse search command arguments (see CommandParser.parse_search_args)."""
+    if not args:
+        return None, "No search query provided"
+
+    values = {}
+    remaining = iter(args)
+
+    for arg in remaining:
+        switch = _SEARCH_SWITCHES.get(arg)
+        if switch is not None:
+            field, value = switch
+            values[field] = value
+            continue
+
+        field = _SEARCH_VALUE_FLAGS.get(arg)
+        if field is not None:
+            # The flag's value is the next argument
+            value = next(remaining, None)
+            if value is None:
+                return None, f"{arg} requires a value"
+            values[field] = value
+            continue
+
+        # Assume it's the keyword
+        values.setdefault('keyword', arg)
+
+    return SearchOptions(**values), None
@@ -0,0 +1,68 @@
+"""
+Human-friendly formatting of message timestamps.
+Shared by the renderers and SearchResult.
+"""
+
+import sys
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Optional
+
+
+# Stream timestamps look like "2025-11-20T20:42:25.971701Z". From Python 3.11
+# fromisoformat reads them as they are; older versions need the "Z" spelled
+# as an offset first.
+if sys.version_info >= (3, 11):
+    _parse_iso = datetime.fromisoformat
+else:
+    def _parse_iso(value: str) -> datetime:
+        """Parse an ISO timestamp with a trailing Z (Python < 3.11)."""
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+@lru_cache(maxsize=4096)
+def _format_human_date_cached(created_at: str, today_ordinal: int) -> str:
+    """
+    Format an ISO timestamp relative to a given day (see format_human_date).
+
+    The current day is part of the cache key, so "Today"/"Yesterday" labels
+    are recomputed once the date changes.
+    """
+    try:
+        dt = _parse_iso(created_at)
+        local_dt = dt.astimezone()
+
+        days_diff = today_ordinal - local_dt.toordinal()
+
+        if days_diff == 0:
+            return f"Today {local_dt.strftime('%I:%M %p')}"
+        elif days_diff == 1:
+            return f"Yesterday {local_dt.strftime('%I:%M %p')}"
+        elif days_diff < 7:
+            return local_dt.strftime('%a %I:%M %p')
+        else:
+            return local_dt.strftime('%b %d, %I:%M %p')
+    except (ValueError, TypeError, AttributeError, OverflowError, OSError):
+        # Malformed or non-string timestamps (parse errors), and dates the
+        # platform can't convert to local time, are shown as given
+        return created_at
+
+
+def format_human_date(created_at: str, today_ordinal: Optional[int] = None) -> str:
+    """
+    Format date in human-friendly format (today, yesterday, or date).
+
+    Results are cached per timestamp and day, since the same messages are
+    re-rendered on every page view.
+
+    Args:
+        created_at: ISO format datetime string
+        today_ordinal: Ordinal of the local date to format relative to;
+            list renderers look it up once per page (default: today)
+
+    Returns:
+        Human-friendly date string
+    """
+    if today_ordinal is None:
+        today_ordinal = date.today().toordinal()
+    return _format_human_date_cached(created_at, today_ordinal)
@@ -3,8 +3,14 @@ Refactored Interactive CLI with clean separation of concerns.
 Follows Single Responsibility Principle and layered architecture.
 """
 
+import io
+import os
+import re
 import shlex
-from typing import Dict, Any, List
+import sys
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Callable, Optional, Tuple
 
 from .view_context import ViewContext, ViewMode
 from .renderers import (
@@ -14,14 +20,154 @@ from .renderers import (
     ChannelRenderer
 )
 from .navigation import NavigationController
-from .command_parser import CommandParser
-from .search import MessageSearcher
-from .pagination import MultiChannelPaginator
-from .colors import Colors, print_separator, print_header
+from .command_parser import CommandParser, SearchOptions
+from .search import MessageSearcher, SearchResult
+from .pagination import MultiChannelPaginator, sort_by_created_at
+from .colors import Colors, format_header, format_separator
 from .logger import get_logger
 
 logger = get_logger()
 
+# Number of recent searches whose results are kept for reuse
+_SEARCH_CACHE_SIZE = 32
+
+# Command-line tokens: a double- or single-quoted string, or a bare word
+# (whitespace is shlex's: space, tab, CR, LF)
+_ARG_RE = re.compile(r'"([^"\\]*)"|\'([^\']*)\'|([^ \t\r\n"\'\\]+)')
+# Lines made only of such tokens, each separated by whitespace; for these the
+# regex split gives exactly what shlex.split would
+_SIMPLE_LINE_RE = re.compile(r'[ \t\r\n]*(?:(?:"[^"\\]*"|\'[^\']*\'|[^ \t\r\n"\'\\]+)(?:[ \t\r\n]+|$))*')
+
+
+def _split_command_line(
+    command_line: str,
+    shlex_split: Callable[[str], List[str]] = shlex.split
+) -> List[str]:
+    """
+    Split a command line into words, honouring quotes.
+
+    Handles plain words and standalone quoted strings with a compiled regex;
+    anything else (backslashes, quotes glued to other text, unbalanced quotes)
+    goes through shlex_split.
+
+    Args:
+        command_line: Raw input line
+        shlex_split: Fallback splitter with shlex.split semantics
+
+    Returns:
+        List of words with quotes removed
+
+    Raises:
+        ValueError: If shlex cannot parse the line (e.g. no closing quote)
+    """
+    if _SIMPLE_LINE_RE.fullmatch(command_line):
+        return [match.group(match.lastindex) for match in _ARG_RE.finditer(command_line)]
+    return shlex_split(command_line)
+
+# Settings accepted by 'set', by value type
+_BOOL_KEYS = frozenset({'show_user_id', 'show_channel_id', 'show_message_id', 'show_date', 'show_full_text'})
+_INT_KEYS = frozenset({'max_text_length', 'results_per_page'})
+
+# Static UI text, colored once at import time
+_EXIT_HINT = f"{Colors.info('Use')} {Colors.command('quit')} {Colors.info('or')} {Colors.command('exit')} {Colors.info('to exit the CLI.')}"
+_HELP_HINT = f"{Colors.info('Type')} {Colors.command('help')} {Colors.info('for available commands.')}"
+_SELECT_USAGE = f"{Colors.warning('Usage:')} {Colors.command('select <index|name>')}"
+_PAGE_USAGE = f"{Colors.warning('Usage:')} {Colors.command('page <number>')}"
+_SEARCH_USAGE = "\n".join([
+    f"\n{Colors.warning('Usage:')} {Colors.command('search <keyword> [options]')}",
+    f"\n{Colors.header('Options:')}",
+    f"  {Colors.command('--user <name>')}      {Colors.muted('Search by username only')}",
+    f"  {Colors.command('--case')}             {Colors.muted('Case-sensitive search')}",
+    f"  {Colors.command('--text-only')}        {Colors.muted('Search text only (not usernames)')}",
+    f"  {Colors.command('--user-only')}        {Colors.muted('Search usernames only (not text)')}",
+])
+_SET_EXAMPLE = "\n".join([
+    f"{Colors.info('Example:')} {Colors.command('set show_full_text true')}",
+    f"          {Colors.command('set results_per_page 20')}",
+])
+_AVAILABLE_FIELDS = "\n".join([
+    f"\n{Colors.header('Available fields:')}",
+    "  " + Colors.muted(", ".join(['user_name', 'user_id', 'channel_name', 'channel_id',
+                                   'message_id', 'text', 'date', 'matched_field'])),
+])
+_FIELDS_USAGE = "\n".join([
+    f"\n{Colors.header('Usage:')}",
+    f"  {Colors.command('fields add <field>')}    {Colors.muted('- Add a field to display')}",
+    f"  {Colors.command('fields remove <field>')} {Colors.muted('- Remove a field from display')}",
+])
+_WELCOME_HINTS = "\n".join([
+    f"\n{Colors.info('>')} Type {Colors.command('help')} for available commands",
+    f"{Colors.info('>')} Type {Colors.command('list')} to see all channels",
+    f"{Colors.info('>')} Type {Colors.command('quit')} or {Colors.command('exit')} to exit",
+])
+# Startup banner; only the two counts change between runs
+_WELCOME_TEMPLATE = "".join([
+    "\n",
+    format_header("PATREON CHANNEL BROWSER"),
+    f"\n{Colors.success('[OK] Loaded')} {{channels}} {Colors.info('channels')} with {{messages}} {Colors.info('messages')}\n",
+    f"{_WELCOME_HINTS}\n",
+    format_separator(),
+])
+# Labels of the stats block, colored once
+_STATS_HEADER = "\n" + format_header("STATISTICS")
+_STATS_CHANNELS = Colors.info('Total Channels:')
+_STATS_MESSAGES = Colors.info('Total Messages:')
+_STATS_CURRENT = Colors.info('Current Channel:')
+_STATS_RESULTS = Colors.info('Last Search Results:')
+_FETCH_HINT = f"{Colors.info('Use')} {Colors.command('fetch <limit>')} {Colors.info('to load more messages from the server.')}"
+_NO_CHANNEL_WARNING = Colors.warning("[!] No channel selected. Use 'select <index>' first.")
+_NO_CHANNEL_ERROR = Colors.error("No channel selected. Use 'select <index>' first.")
+_NO_CID_ERROR = Colors.error("Channel CID not found.")
+_NO_MESSAGES_WARNING = Colors.warning("No messages in this channel.")
+_NO_RESULTS_WARNING = Colors.warning("No results found.")
+_NO_KEYWORD_ERROR = Colors.error("Please provide a search keyword or --user option")
+_FIRST_PAGE_WARNING = Colors.warning("Already on the first page.")
+
+
+class _CommandNode:
+    """Node of the command-name trie."""
+
+    __slots__ = ('children', 'names')
+
+    def __init__(self) -> None:
+        self.children: Dict[str, '_CommandNode'] = {}
+        # Every command name that starts with the path to this node
+        self.names: List[str] = []
+
+
+class _CommandTrie:
+    """Prefix trie over command names, so commands can be abbreviated (sel -> select)."""
+
+    def __init__(self) -> None:
+        self._root = _CommandNode()
+
+    def insert(self, name: str) -> None:
+        """Add a command name."""
+        node = self._root
+        for char in name:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _CommandNode()
+            node = child
+            node.names.append(name)
+
+    def find(self, prefix: str) -> List[str]:
+        """
+        Get all command names starting with a prefix.
+
+        Args:
+            prefix: Typed command name
+
+        Returns:
+            Matching command names in registration order (empty if none)
+        """
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.names
+
 
 class InteractiveCLI:
     """
@@ -29,6 +175,30 @@ class InteractiveCLI:
     Refactored to follow clean architecture principles.
     """
 
+    # Help layout: command groups and usage examples
+    _CATEGORIES = (
+        ('Navigation', ('list', 'select', 'show', 'next', 'prev', 'page')),
+        ('Viewing', ('messages', 'stats', 'fields')),
+        ('Search', ('search',)),
+        ('Data', ('fetch',)),
+        ('Configuration', ('config', 'set')),
+        ('System', ('help', 'clear', 'quit', 'exit')),
+    )
+    _EXAMPLES = (
+        ("list", "Show all channels"),
+        ("select 1", "Select first channel"),
+        ('select "Easy Investing"', "Select channel by name"),
+        ("messages 20", "Show 20 messages"),
+        ('search "NVIDIA"', "Search for keyword"),
+        ("search --user Chris", "Search by username"),
+        ('search --case "VRT"', "Case-sensitive search"),
+        ("fetch 100", "Fetch 100 more messages"),
+        ("set show_full_text true", "Show full message text"),
+        ("set results_per_page 20", "Show 20 results per page"),
+        ("fields add message_id", "Show message IDs"),
+        ("fields remove date", "Hide dates"),
+    )
+
     def __init__(self, channels_data: Dict[str, Any], client: Any) -> None:
         """
         Initialize the interactive CLI.
@@ -42,7 +212,13 @@ class InteractiveCLI:
         # Core dependencies
         self.client = client
         self.searcher = MessageSearcher(channels_data)
-        self.multi_paginator = MultiChannelPaginator(client)
+        # Re-indexing after a fetch runs here so the prompt returns immediately
+        self._index_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reindex")
+        self._index_future: Optional[Future] = None
+        # Results of recent searches, least recently used first; cleared
+        # whenever fetched messages change the index
+        self._search_cache: "OrderedDict[SearchOptions, List[SearchResult]]" = OrderedDict()
+        self.multi_paginator = MultiChannelPaginator(client, channels_data=channels_data)
 
         # View management
         self.context = ViewContext(channels_data=channels_data)
@@ -55,12 +231,22 @@ class InteractiveCLI:
 
         # Parser
         self.parser = CommandParser()
+        # One lexer for the session, reset per line (configured like shlex.split's)
+        self._shlex = shlex.shlex('', posix=True)
+        self._shlex.whitespace_split = True
+        self._shlex.commenters = ''
+
+        # Screen clearing: ANSI escape on terminals (colors.py has already set
+        # up Windows consoles for escape sequences), shell command otherwise
+        self._clear_cmd = 'cls' if os.name == 'nt' else 'clear'
+        self._use_ansi_clear = sys.stdout.isatty()
 
         # State
         self.running = False
+        self._help_cache: Optional[str] = None
 
         # Command registry
-        self.commands: Dict[str, tuple] = {
+        self.commands: Dict[str, Tuple[Callable[[List[str]], None], str]] = {
             'help': (self.cmd_help, 'Show available commands'),
             'list': (self.cmd_list_channels, 'List all channels'),
             'select': (self.cmd_select_channel, 'Select a channel by index or name'),
@@ -79,6 +265,14 @@ class InteractiveCLI:
             'quit': (self.cmd_quit, 'Exit the CLI'),
             'exit': (self.cmd_quit, 'Exit the CLI'),
         }
+        # Handlers alone, for dispatch; self.commands keeps the descriptions for help
+        self._handlers: Dict[str, Callable[[List[str]], None]] = {
+            name: handler for name, (handler, _) in self.commands.items()
+        }
+        # Prefix lookup for abbreviated commands; full names go through _handlers
+        self._command_trie = _CommandTrie()
+        for name in self.commands:
+            self._command_trie.insert(name)
 
         logger.info("InteractiveCLI v2 initialized successfully")
 
@@ -96,23 +290,29 @@ class InteractiveCLI:
                 self.execute_command(command_line)
 
             except KeyboardInterrupt:
-                print(f"\n\n{Colors.info('Use')} {Colors.command('quit')} {Colors.info('or')} {Colors.command('exit')} {Colors.info('to exit the CLI.')}")
+                print(f"\n\n{_EXIT_HINT}")
             except EOFError:
                 break
             except Exception as e:
-                logger.exception(f"Unexpected error: {e}")
+                logger.exception("Unexpected error: %s", e)
                 print(Colors.error(f"Error: {e}"))
 
+        self._index_executor.shutdown(wait=False)
+
     def execute_command(self, command_line: str) -> None:
         """Parse and execute a command."""
-        logger.debug(f"Executing command: {command_line}")
+        logger.debug("Executing command: %s", command_line)
 
-        try:
-            parts = shlex.split(command_line)
-        except ValueError as e:
-            logger.error(f"Invalid command syntax: {e}")
-            print(Colors.error(f"Invalid command syntax: {e}"))
-            return
+        if '"' in command_line or "'" in command_line or '\\' in command_line:
+            try:
+                parts = _split_command_line(command_line, self._shlex_split)
+            except ValueError as e:
+                logger.error("Invalid command syntax: %s", e)
+                print(Colors.error(f"Invalid command syntax: {e}"))
+                return
+        else:
+            # Nothing to unquote or unescape, so a plain whitespace split is equivalent
+            parts = command_line.split()
 
         if not parts:
             return
@@ -120,141 +320,155 @@ class InteractiveCLI:
         cmd_name = parts[0].lower()
         args = parts[1:]
 
-        logger.info(f"Command: {cmd_name}, Args: {args}")
-
-        if cmd_name in self.commands:
-            handler, _ = self.commands[cmd_name]
+        logger.info("Command: %s, Args: %s", cmd_name, args)
+
+        handler = self._handlers.get(cmd_name)
+        if handler is None:
+            # Not a full command name: accept an unambiguous prefix
+            candidates = self._command_trie.find(cmd_name)
+            if len({self._handlers[name] for name in candidates}) > 1:
+                logger.warning("Ambiguous command: %s", cmd_name)
+                print(Colors.error(f"Ambiguous command: {cmd_name}"))
+                print(f"{Colors.info('Did you mean:')} {', '.join(Colors.command(name) for name in candidates)}")
+                return
+            if candidates:
+                cmd_name = candidates[0]
+                handler = self._handlers[cmd_name]
+
+        if handler is not None:
             try:
                 handler(args)
-                logger.debug(f"Command '{cmd_name}' executed successfully")
+                logger.debug("Command '%s' executed successfully", cmd_name)
             except Exception as e:
-                logger.exception(f"Error executing command '{cmd_name}': {e}")
+                logger.exception("Error executing command '%s': %s", cmd_name, e)
                 print(Colors.error(f"Error executing command: {e}"))
         else:
-            logger.warning(f"Unknown command: {cmd_name}")
+            logger.warning("Unknown command: %s", cmd_name)
             print(Colors.error(f"Unknown command: {cmd_name}"))
-            print(f"{Colors.info('Type')} {Colors.command('help')} {Colors.info('for available commands.')}")
+            print(_HELP_HINT)
 
     # ========== Command Handlers ==========
 
     def cmd_help(self, args: List[str]) -> None:
         """Show help information."""
-        print()
-        print_header("AVAILABLE COMMANDS")
-
-        categories = {
-            'Navigation': ['list', 'select', 'show', 'next', 'prev', 'page'],
-            'Viewing': ['messages', 'stats', 'fields'],
-            'Search': ['search'],
-            'Data': ['fetch'],
-            'Configuration': ['config', 'set'],
-            'System': ['help', 'clear', 'quit', 'exit']
-        }
+        # Commands are fixed after __init__, so the rendered text never goes stale
+        if self._help_cache is None:
+            self._help_cache = self._build_help()
+
+        # One write for the whole block instead of a print per line
+        sys.stdout.write(self._help_cache)
+        sys.stdout.flush()
 
-        for category, cmds in categories.items():
-            print(f"\n{Colors.header(category)}:")
+    def _build_help(self) -> str:
+        """
+        Render the help text.
+
+        Returns:
+            Complete help block, trailing newline included
+        """
+        parts = ["\n", format_header("AVAILABLE COMMANDS")]
+
+        for category, cmds in self._CATEGORIES:
+            parts.append(f"\n{Colors.header(category)}:\n")
             for cmd in cmds:
-                if cmd in self.commands:
-                    _, desc = self.commands[cmd]
-                    print(f"  {Colors.command(cmd):25} - {desc}")
-
-        print()
-        print_separator()
-        print(Colors.header("EXAMPLES:"))
-        examples = [
-            ("list", "Show all channels"),
-            ("select 1", "Select first channel"),
-            ('select "Easy Investing"', "Select channel by name"),
-            ("messages 20", "Show 20 messages"),
-            ('search "NVIDIA"', "Search for keyword"),
-            ("search --user Chris", "Search by username"),
-            ('search --case "VRT"', "Case-sensitive search"),
-            ("fetch 100", "Fetch 100 more messages"),
-            ("set show_full_text true", "Show full message text"),
-            ("set results_per_page 20", "Show 20 results per page"),
-            ("fields add message_id", "Show message IDs"),
-            ("fields remove date", "Hide dates"),
-        ]
-        for cmd, desc in examples:
-            print(f"  {Colors.command(cmd):35} - {Colors.muted(desc)}")
-        print_separator()
+                entry = self.commands.get(cmd)
+                if entry is not None:
+                    parts.append(f"  {Colors.command(f'{cmd:16}')} - {entry[1]}\n")
+
+        parts.append("\n")
+        parts.append(format_separator())
+        parts.append(f"{Colors.header('EXAMPLES:')}\n")
+        for cmd, desc in self._EXAMPLES:
+            parts.append(f"  {Colors.command(f'{cmd:26}')} - {Colors.muted(desc)}\n")
+        parts.append(format_separator())
+
+        return "".join(parts)
 
     def cmd_list_channels(self, args: List[str]) -> None:
         """List all available channels."""
-        channels = self.context.channels_data.get('channels', [])
-        ChannelRenderer.render_channel_list(channels)
+        ChannelRenderer.render_channel_list(self.context.channels)
 
     def cmd_select_channel(self, args: List[str]) -> None:
         """Select a channel by index or name."""
-        logger.info(f"cmd_select_channel called with args: {args}")
+        logger.info("cmd_select_channel called with args: %s", args)
 
         if not args:
-            print(f"{Colors.warning('Usage:')} {Colors.command('select <index|name>')}")
+            print(_SELECT_USAGE)
             return
 
-        channels = self.context.channels_data.get('channels', [])
+        channels = self.context.channels
 
         # Try to parse as index
         try:
             index = int(args[0])
-            logger.debug(f"Attempting to select channel by index: {index}")
+            logger.debug("Attempting to select channel by index: %s", index)
 
             if 1 <= index <= len(channels):
-                channel = channels[index - 1].get('channel', {})
+                channel = channels[index - 1]
                 self.context.select_channel(channel, index - 1)
 
-                channel_name = channel.get('name', 'Unknown')
-                logger.info(f"Selected channel: {channel_name}")
+                channel_name = self.context.channel_names[index - 1]
+                logger.info("Selected channel: %s", channel_name)
 
                 print(f"\n{Colors.success('[OK] Selected channel:')} {Colors.channel(channel_name)}")
                 self.cmd_show_channel([])
             else:
-                logger.warning(f"Invalid channel index: {index}")
+                logger.warning("Invalid channel index: %s", index)
                 print(Colors.error(f"[X] Invalid index. Must be between 1 and {len(channels)}"))
 
         except ValueError:
             # Search by name
             search_name = ' '.join(args).lower()
-            logger.debug(f"Searching for channel by name: {search_name}")
-
-            for idx, channel_wrapper in enumerate(channels):
-                channel = channel_wrapper.get('channel', {})
-                if search_name in channel.get('name', '').lower():
-                    self.context.select_channel(channel, idx)
-
-                    channel_name = channel.get('name', 'Unknown')
-                    logger.info(f"Found and selected channel: {channel_name}")
+            logger.debug("Searching for channel by name: %s", search_name)
+
+            # Exact name first, then channels starting with the text, then any containing it
+            matches = self.context.find_channels(search_name)
+            if len(matches) > 1:
+                logger.info("Channel name '%s' is ambiguous: %s matches", search_name, len(matches))
+                print(Colors.warning(f"[!] Multiple channels match '{' '.join(args)}':"))
+                for idx in matches:
+                    print(f"  {Colors.value(f'{idx + 1:<5}')} {Colors.channel(self.context.channel_names[idx])}")
+                print(_SELECT_USAGE)
+                return
+
+            if matches:
+                idx = matches[0]
+                channel = channels[idx]
+                self.context.select_channel(channel, idx)
+
+                channel_name = self.context.channel_names[idx]
+                logger.info("Found and selected channel: %s", channel_name)
 
-                    print(f"\n{Colors.success('[OK] Selected channel:')} {Colors.channel(channel_name)}")
-                    self.cmd_show_channel([])
-                    return
+                print(f"\n{Colors.success('[OK] Selected channel:')} {Colors.channel(channel_name)}")
+                self.cmd_show_channel([])
+                return
 
-            logger.warning(f"No channel found matching: {search_name}")
+            logger.warning("No channel found matching: %s", search_name)
             print(Colors.error(f"[X] No channel found matching: {' '.join(args)}"))
 
     def cmd_show_channel(self, args: List[str]) -> None:
         """Show details of the current channel."""
         if not self.context.has_channel():
-            print(Colors.warning("[!] No channel selected. Use 'select <index>' first."))
+            print(_NO_CHANNEL_WARNING)
             return
 
         message_count = len(self.context.get_current_messages())
-        ChannelRenderer.render_channel_details(self.context.current_channel, message_count)
+        # Render the details into a buffer and write them out in one go
+        buf = io.StringIO()
+        ChannelRenderer.render_channel_details(self.context.current_channel, message_count, file=buf)
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
     def cmd_show_messages(self, args: List[str]) -> None:
         """Show messages from the current channel."""
-        logger.info(f"cmd_show_messages called with args: {args}")
+        logger.info("cmd_show_messages called with args: %s", args)
 
         if not self.context.has_channel():
-            print(Colors.warning("[!] No channel selected. Use 'select <index>' first."))
+            print(_NO_CHANNEL_WARNING)
             return
 
         # Parse limit
-        limit, error = self.parser.parse_int_arg(
-            args,
-            self.display_config.results_per_page,
-            "limit"
-        )
+        limit, error = self.parser.parse_int_arg(args, self.display_config.results_per_page, "limit")
         if error:
             print(Colors.error(error))
             return
@@ -262,10 +476,11 @@ class InteractiveCLI:
         # Update items per page if custom limit provided
         if args:
             self.navigation.set_items_per_page(limit)
+            self.context.total_pages = None
 
         messages = self.context.get_current_messages()
         if not messages:
-            print(Colors.warning("No messages in this channel."))
+            print(_NO_MESSAGES_WARNING)
             return
 
         # Determine if this is first view (auto-jump to newest)
@@ -284,9 +499,11 @@ class InteractiveCLI:
 
         # Update context page
         self.context.current_page = result.current_page
+        self.context.total_pages = result.total_pages
 
         # Render
-        channel_name = self.context.current_channel.get('name', 'Unknown')
+        channel_name = self.context.channel_names[self.context.current_channel_index]
+        # The renderer writes the whole page in one go
         self.message_renderer.render_message_list(
             result.items,
             channel_name,
@@ -296,16 +513,13 @@ class InteractiveCLI:
             result.end_idx,
             result.total_items
         )
+        sys.stdout.flush()
 
     def cmd_search(self, args: List[str]) -> None:
         """Search messages with various options."""
         if not args:
-            print(f"\n{Colors.warning('Usage:')} {Colors.command('search <keyword> [options]')}")
-            print(f"\n{Colors.header('Options:')}")
-            print(f"  {Colors.command('--user <name>')}      {Colors.muted('Search by username only')}")
-            print(f"  {Colors.command('--case')}             {Colors.muted('Case-sensitive search')}")
-            print(f"  {Colors.command('--text-only')}        {Colors.muted('Search text only (not usernames)')}")
-            print(f"  {Colors.command('--user-only')}        {Colors.muted('Search usernames only (not text)')}")
+            sys.stdout.write(_SEARCH_USAGE + "\n")
+            sys.stdout.flush()
             return
 
         # Parse search options
@@ -314,30 +528,57 @@ class InteractiveCLI:
             print(Colors.error(error))
             return
 
+        if options.user:
+            print(f"\n{Colors.info('Searching for user:')} {Colors.username(options.user)}")
+        elif options.keyword:
+            print(f"\n{Colors.info('Searching for:')} {Colors.highlight(options.keyword)}")
+        else:
+            print(_NO_KEYWORD_ERROR)
+            return
+
         # Execute search
+        results = self._run_search(options)
+
+        # Update context
+        self.context.set_search_results(results)
+
+        # Display results
+        self._display_current_view()
+
+    def _run_search(self, options: SearchOptions) -> List[SearchResult]:
+        """
+        Run a search, reusing the results of a recent identical one.
+
+        Args:
+            options: Parsed search options (with a user or a keyword)
+
+        Returns:
+            List of search results
+        """
+        cache = self._search_cache
+        results = cache.get(options)
+        if results is not None:
+            cache.move_to_end(options)
+            return results
+
+        self._wait_for_index()
         if options.user:
             results = self.searcher.search_by_user(
                 options.user,
                 case_sensitive=options.case_sensitive
             )
-            print(f"\n{Colors.info('Searching for user:')} {Colors.username(options.user)}")
-        elif options.keyword:
+        else:
             results = self.searcher.search(
                 options.keyword,
                 search_text=options.search_text,
                 search_usernames=options.search_usernames,
                 case_sensitive=options.case_sensitive
             )
-            print(f"\n{Colors.info('Searching for:')} {Colors.highlight(options.keyword)}")
-        else:
-            print(Colors.error("Please provide a search keyword or --user option"))
-            return
 
-        # Update context
-        self.context.set_search_results(results)
-
-        # Display results
-        self._display_current_view()
+        cache[options] = results
+        if len(cache) > _SEARCH_CACHE_SIZE:
+            cache.popitem(last=False)
+        return results
 
     def cmd_next_page(self, args: List[str]) -> None:
         """Go to the next page."""
@@ -355,9 +596,9 @@ class InteractiveCLI:
 
         if message:
             if "first page" in message:
-                print(Colors.warning("Already on the first page."))
+                print(_FIRST_PAGE_WARNING)
                 if self.context.is_viewing_messages():
-                    print(f"{Colors.info('Use')} {Colors.command('fetch <limit>')} {Colors.info('to load more messages from the server.')}")
+                    print(_FETCH_HINT)
             else:
                 print(Colors.warning(message))
         else:
@@ -367,7 +608,7 @@ class InteractiveCLI:
     def cmd_goto_page(self, args: List[str]) -> None:
         """Go to a specific page number."""
         if not args:
-            print(f"{Colors.warning('Usage:')} {Colors.command('page <number>')}")
+            print(_PAGE_USAGE)
             return
 
         page_num, error = self.parser.parse_int_arg(args, 1, "page number")
@@ -385,10 +626,10 @@ class InteractiveCLI:
 
     def cmd_fetch_more(self, args: List[str]) -> None:
         """Fetch more messages from the current channel."""
-        logger.info(f"cmd_fetch_more called with args: {args}")
+        logger.info("cmd_fetch_more called with args: %s", args)
 
         if not self.context.has_channel():
-            print(Colors.error("No channel selected. Use 'select <index>' first."))
+            print(_NO_CHANNEL_ERROR)
             return
 
         limit, error = self.parser.parse_int_arg(args, 50, "limit")
@@ -396,12 +637,12 @@ class InteractiveCLI:
             print(Colors.error(error))
             return
 
-        cid = self.context.current_channel.get('cid')
+        cid = self.context.channel_cids[self.context.current_channel_index]
         if not cid:
-            print(Colors.error("Channel CID not found."))
+            print(_NO_CID_ERROR)
             return
 
-        logger.info(f"Fetching up to {limit} messages from channel CID: {cid}")
+        logger.info("Fetching up to %s messages from channel CID: %s", limit, cid)
         print(f"{Colors.info('Fetching')} {Colors.highlight(str(limit))} {Colors.info('more messages...')}")
 
         try:
@@ -410,43 +651,48 @@ class InteractiveCLI:
 
             paginator = self.multi_paginator.get_paginator(cid)
 
-            # If we have existing messages, set the paginator state to continue from the oldest message
+            # If we have existing messages, continue from the oldest one; messages
+            # are kept oldest first, so its ID is the first message's
             if old_messages:
-                # Find the oldest message ID to continue pagination from
-                oldest_msg = min(old_messages, key=lambda m: m.get('created_at', ''))
-                paginator.state.last_message_id = oldest_msg.get('id')
-                paginator.state.has_more = True  # Re-enable fetching
+                paginator.resume_from(old_messages[0].get('id'))
 
             # Fetch more messages (continuing from where we left off)
             new_messages = paginator.fetch_all(page_size=100, max_messages=limit)
 
-            # Merge old and new messages, deduplicate, and sort
-            all_messages = old_messages + new_messages
-
-            # Deduplicate by message ID
-            seen_ids = set()
-            unique_messages = []
-            for msg in all_messages:
+            # Existing messages are already unique, so only the new ones need checking
+            seen_ids = {msg.get('id') for msg in old_messages}
+            additions = []
+            for msg in new_messages:
                 msg_id = msg.get('id')
                 if msg_id and msg_id not in seen_ids:
                     seen_ids.add(msg_id)
-                    unique_messages.append(msg)
+                    additions.append(msg)
 
-            # Sort by created_at (oldest first)
-            unique_messages.sort(key=lambda msg: msg.get('created_at', ''))
+            # Merge and sort by created_at (oldest first). Both parts are already
+            # sorted, so the sort only has to merge two runs.
+            unique_messages = old_messages + additions
+            sort_by_created_at(unique_messages)
 
             # Update context
             self.context.update_channel_messages(unique_messages)
-
-            # Refresh searcher
-            self.searcher = MessageSearcher(self.context.channels_data)
+            if self.context.is_viewing_messages():
+                # Keep the page count of the messages view current
+                self.context.total_pages = self.navigation.calculate_total_pages(len(unique_messages))
+
+            # Re-index only the channel that changed, in the background; the
+            # executor is serial, so queued re-indexes finish in fetch order.
+            # Cached search results predate the new messages.
+            self._search_cache.clear()
+            self._index_future = self._index_executor.submit(
+                self.searcher.replace_channel, self.context.current_channel_index, unique_messages
+            )
 
             fetched_count = len(unique_messages) - old_count
             print(f"{Colors.success('[OK] Fetched')} {Colors.highlight(str(fetched_count))} {Colors.info('new messages')} {Colors.muted(f'(total: {len(unique_messages)})')}")
-            logger.info(f"Fetch complete: {old_count} -> {len(unique_messages)} messages")
+            logger.info("Fetch complete: %s -> %s messages", old_count, len(unique_messages))
 
         except Exception as e:
-            logger.exception(f"Error fetching messages: {e}")
+            logger.exception("Error fetching messages: %s", e)
             print(Colors.error(f"Error fetching messages: {e}"))
 
     def cmd_show_config(self, args: List[str]) -> None:
@@ -459,24 +705,24 @@ class InteractiveCLI:
 
         if error:
             print(f"{Colors.warning(error)}")
-            print(f"{Colors.info('Example:')} {Colors.command('set show_full_text true')}")
-            print(f"          {Colors.command('set results_per_page 20')}")
+            print(_SET_EXAMPLE)
             return
 
         # Boolean values
-        if key in ['show_user_id', 'show_channel_id', 'show_message_id', 'show_date', 'show_full_text']:
+        if key in _BOOL_KEYS:
             bool_val = self.parser.parse_bool_arg(value)
             setattr(self.display_config, key, bool_val)
             print(f"{Colors.success('[OK] Set')} {Colors.info(key)} = {Colors.value(str(bool_val))}")
 
         # Integer values
-        elif key in ['max_text_length', 'results_per_page']:
+        elif key in _INT_KEYS:
             try:
                 int_val = int(value)
                 setattr(self.display_config, key, int_val)
                 # Update navigation controller
                 if key == 'results_per_page':
                     self.navigation.set_items_per_page(int_val)
+                    self.context.total_pages = None
                 print(f"{Colors.success('[OK] Set')} {Colors.info(key)} = {Colors.value(str(int_val))}")
             except ValueError:
                 print(Colors.error(f"Invalid integer value: {value}"))
@@ -494,41 +740,41 @@ class InteractiveCLI:
 
         if not action:
             # Show help
-            print(f"\n{Colors.header('Available fields:')}")
-            all_fields = ['user_name', 'user_id', 'channel_name', 'channel_id',
-                         'message_id', 'text', 'date', 'matched_field']
-            print("  " + Colors.muted(", ".join(all_fields)))
-            print(f"\n{Colors.info('Currently visible:')} {Colors.value(', '.join(sorted(self.display_config.visible_fields)))}")
-            print(f"\n{Colors.header('Usage:')}")
-            print(f"  {Colors.command('fields add <field>')}    {Colors.muted('- Add a field to display')}")
-            print(f"  {Colors.command('fields remove <field>')} {Colors.muted('- Remove a field from display')}")
+            print(_AVAILABLE_FIELDS)
+            print(f"\n{Colors.info('Currently visible:')} {Colors.value(self.display_config.visible_fields_str)}")
+            print(_FIELDS_USAGE)
             return
 
         if action == 'add':
-            self.display_config.visible_fields.add(field)
+            self.display_config.add_field(field)
             print(f"{Colors.success('[OK] Added field:')} {Colors.value(field)}")
         elif action == 'remove':
-            self.display_config.visible_fields.discard(field)
+            self.display_config.remove_field(field)
             print(f"{Colors.success('[OK] Removed field:')} {Colors.value(field)}")
 
     def cmd_clear_screen(self, args: List[str]) -> None:
         """Clear the screen."""
-        import os
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self._use_ansi_clear:
+            sys.stdout.write('\x1b[2J\x1b[H')
+            sys.stdout.flush()
+        else:
+            os.system(self._clear_cmd)
 
     def cmd_show_stats(self, args: List[str]) -> None:
         """Show statistics."""
-        print()
-        print_separator()
-        print(Colors.header("STATISTICS".center(80)))
-        print_separator()
-        print(f"{Colors.info('Total Channels:')}        {Colors.value(str(self.searcher.get_channel_count()))}")
-        print(f"{Colors.info('Total Messages:')}        {Colors.value(str(self.searcher.get_total_message_count()))}")
+        self._wait_for_index()
+        parts = [
+            _STATS_HEADER,
+            f"{_STATS_CHANNELS}        {Colors.value(str(self.searcher.get_channel_count()))}\n",
+            f"{_STATS_MESSAGES}        {Colors.value(str(self.searcher.get_total_message_count()))}\n",
+        ]
         if self.context.has_channel():
-            print(f"{Colors.info('Current Channel:')}       {Colors.channel(self.context.current_channel.get('name', 'Unknown'))}")
+            parts.append(f"{_STATS_CURRENT}       {Colors.channel(self.context.channel_names[self.context.current_channel_index])}\n")
         if self.context.search_results:
-            print(f"{Colors.info('Last Search Results:')}   {Colors.highlight(str(len(self.context.search_results)))}")
-        print_separator()
+            parts.append(f"{_STATS_RESULTS}   {Colors.highlight(str(len(self.context.search_results)))}\n")
+        parts.append(format_separator())
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
 
     def cmd_quit(self, args: List[str]) -> None:
         """Exit the CLI."""
@@ -537,6 +783,39 @@ class InteractiveCLI:
 
     # ========== Helper Methods ==========
 
+    def _shlex_split(self, line: str) -> List[str]:
+        """
+        Split a line like shlex.split, reusing the session's lexer.
+
+        Args:
+            line: Raw input line
+
+        Returns:
+            List of words
+
+        Raises:
+            ValueError: If the line has an unterminated quote or escape
+        """
+        lexer = self._shlex
+        # Clear whatever a previous (possibly failed) line left behind
+        lexer.instream = io.StringIO(line)
+        lexer.state = ' '
+        lexer.token = ''
+        lexer.lineno = 1
+        lexer.pushback.clear()
+        return list(lexer)
+
+    def _wait_for_index(self) -> None:
+        """Block until a pending background re-index has finished."""
+        if self._index_future is None:
+            return
+        future, self._index_future = self._index_future, None
+        try:
+            future.result()
+        except Exception as e:
+            logger.exception("Error re-indexing channel: %s", e)
+            print(Colors.error(f"Error re-indexing channel: {e}"))
+
     def _display_current_view(self) -> None:
         """Display the current view based on context mode."""
         if self.context.is_viewing_search():
@@ -547,14 +826,16 @@ class InteractiveCLI:
     def _display_search_results(self) -> None:
         """Display paginated search results."""
         if not self.context.search_results:
-            print(Colors.warning("No results found."))
+            print(_NO_RESULTS_WARNING)
             return
 
-        result = self.navigation.paginate_search_results(
+        result = self.navigation.paginate_messages(
             self.context.search_results,
             self.context.current_page
         )
+        self.context.total_pages = result.total_pages
 
+        # The renderer writes the whole page in one go
         self.search_renderer.render_search_results(
             result.items,
             result.current_page,
@@ -562,16 +843,15 @@ class InteractiveCLI:
             result.start_idx,
             result.end_idx
         )
+        sys.stdout.flush()
 
     def print_welcome(self) -> None:
         """Print welcome message."""
-        print()
-        print_header("PATREON CHANNEL BROWSER")
-        print(f"\n{Colors.success('[OK] Loaded')} {Colors.highlight(str(self.searcher.get_channel_count()))} {Colors.info('channels')} with {Colors.highlight(str(self.searcher.get_total_message_count()))} {Colors.info('messages')}")
-        print(f"\n{Colors.info('>')} Type {Colors.command('help')} for available commands")
-        print(f"{Colors.info('>')} Type {Colors.command('list')} to see all channels")
-        print(f"{Colors.info('>')} Type {Colors.command('quit')} or {Colors.command('exit')} to exit")
-        print_separator()
+        sys.stdout.write(_WELCOME_TEMPLATE.format(
+            channels=Colors.highlight(str(self.searcher.get_channel_count())),
+            messages=Colors.highlight(str(self.searcher.get_total_message_count())),
+        ))
+        sys.stdout.flush()
 
 
 def start_interactive_cli(channels_data: Dict[str, Any], client: Any) -> None:
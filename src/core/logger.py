@@ -4,78 +4,99 @@ Logs are written to patreon_scrape.log for debugging.
 """
 
 import logging
+import logging.handlers
 import os
 from datetime import datetime
-from typing import Optional
 
 
-class AppLogger:
-    """Application logger singleton."""
+class _LazyFileHandler(logging.FileHandler):
+    """
+    File handler that creates the log directory and file on the first record.
 
-    _instance: Optional['AppLogger'] = None
-    _logger: Optional[logging.Logger] = None
+    Importing a module that asks for the logger then costs no disk I/O; the
+    file (headed by a startup banner) appears once something is logged.
+    """
 
-    def __new__(cls) -> 'AppLogger':
-        """Singleton pattern to ensure single logger instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    def __init__(self, filename: str) -> None:
+        super().__init__(filename, encoding='utf-8', delay=True)
 
-    def __init__(self) -> None:
-        """Initialize the logger if not already initialized."""
-        if self._logger is None:
-            self._setup_logger()
+    def _open(self):
+        """Create the log directory, open the file and write the startup banner."""
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        stream = super()._open()
+        separator = "=" * 80
+        stream.write(f"{separator}\nLogging initialized at {datetime.now()}\n{separator}\n")
+        return stream
 
-    def _setup_logger(self) -> None:
-        """Configure the logger with file and console handlers."""
-        # Create logger
-        self._logger = logging.getLogger('patreon_scrape')
-        self._logger.setLevel(logging.DEBUG)
 
-        # Prevent duplicate handlers
-        if self._logger.handlers:
-            return
+class _LogFormatter(logging.Formatter):
+    """
+    Formatter for the application's log format, assembled with an f-string.
 
-        # Create logs directory if it doesn't exist
-        log_dir = 'logs'
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+    The layout is defined only in formatMessage; Formatter.format still fills
+    in asctime and appends exception and stack information.
+    """
 
-        # File handler - detailed logs
-        log_file = os.path.join(log_dir, 'patreon_scrape.log')
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
+    def usesTime(self) -> bool:
+        """Every line starts with the time, so format always sets asctime."""
+        return True
 
-        # Console handler - only warnings and errors
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.WARNING)
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Build the log line (asctime and message are set by format)."""
+        return f"{record.asctime} - {record.name} - {record.levelname} - [{record.filename}:{record.lineno}] - {record.message}"
 
-        # Formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
 
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
+_LOGGER_NAME = 'patreon_scrape'
+_configured = False
 
-        # Add handlers
-        self._logger.addHandler(file_handler)
-        self._logger.addHandler(console_handler)
 
-        # Log startup
-        self._logger.info("="*80)
-        self._logger.info(f"Logging initialized at {datetime.now()}")
-        self._logger.info("="*80)
+def _configure(logger: logging.Logger) -> None:
+    """Configure the logger with file and console handlers."""
+    logger.setLevel(logging.DEBUG)
 
-    def get_logger(self) -> logging.Logger:
-        """Get the logger instance."""
-        if self._logger is None:
-            self._setup_logger()
-        return self._logger  # type: ignore
+    # Prevent duplicate handlers
+    if logger.handlers:
+        return
+
+    # File handler - detailed logs (the logs directory and file are
+    # created when the first record is written)
+    log_file = os.path.join('logs', 'patreon_scrape.log')
+    file_handler = _LazyFileHandler(log_file)
+    file_handler.setLevel(logging.DEBUG)
+
+    # Console handler - only warnings and errors
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.WARNING)
+
+    # Formatter: "asctime - name - level - [file:line] - message"
+    formatter = _LogFormatter(datefmt='%Y-%m-%d %H:%M:%S')
+
+    file_handler.setFormatter(formatter)
+    console_handler.setFormatter(formatter)
+
+    # Records reach the file in batches: flushed every 1000 records, on
+    # any error, and by logging's own shutdown hook at exit
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=1000,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+
+    # Add handlers
+    logger.addHandler(buffered_handler)
+    logger.addHandler(console_handler)
 
 
-# Global logger instance
 def get_logger() -> logging.Logger:
-    """Get the application logger."""
-    return AppLogger().get_logger()
+    """
+    Get the application logger.
+
+    logging.getLogger already returns one logger per name for the whole
+    process; handlers are attached on the first call.
+    """
+    global _configured
+    logger = logging.getLogger(_LOGGER_NAME)
+    if not _configured:
+        _configure(logger)
+        _configured = True
+    return logger
@@ -7,7 +7,6 @@ from typing import List, Tuple, Optional, Any
 from dataclasses import dataclass
 
 from .view_context import ViewContext
-from .search import SearchResult
 
 
 @dataclass
@@ -42,10 +41,10 @@ class NavigationController:
         auto_jump_to_last: bool = False
     ) -> PaginationResult:
         """
-        Paginate a list of messages.
+        Paginate a list of messages (or search results, which page the same way).
 
         Args:
-            messages: List of messages (oldest first)
+            messages: List of messages (oldest first) or search results
             current_page: Current page number (1-indexed)
             auto_jump_to_last: Whether to jump to last page on first view
 
@@ -63,18 +62,22 @@ class NavigationController:
                 total_items=0
             )
 
-        total_pages = self._calculate_total_pages(total_items)
+        per_page = self.items_per_page
+        total_pages = self.calculate_total_pages(total_items)
 
         # Auto-jump to last page (newest messages) on first view
         if auto_jump_to_last and current_page == 1:
             current_page = total_pages
 
         # Ensure page is in valid range
-        current_page = max(1, min(current_page, total_pages))
+        if current_page > total_pages:
+            current_page = total_pages
+        elif current_page < 1:
+            current_page = 1
 
         # Calculate indices
-        start_idx = (current_page - 1) * self.items_per_page
-        end_idx = min(start_idx + self.items_per_page, total_items)
+        start_idx = (current_page - 1) * per_page
+        end_idx = min(start_idx + per_page, total_items)
 
         # Get items for current page
         page_items = messages[start_idx:end_idx]
@@ -88,48 +91,24 @@ class NavigationController:
             total_items=total_items
         )
 
-    def paginate_search_results(
-        self,
-        results: List[SearchResult],
-        current_page: int
-    ) -> PaginationResult:
+    def _view_total_pages(self, context: ViewContext, items: List[Any]) -> int:
         """
-        Paginate search results.
+        Page count of the view on screen.
+
+        Renders store the count on the context (reset to None whenever it may
+        be stale), so next/page usually skip recomputing it.
 
         Args:
-            results: List of search results
-            current_page: Current page number (1-indexed)
+            context: Current view context
+            items: The view's messages or search results
 
         Returns:
-            PaginationResult with paginated data
+            Total number of pages
         """
-        total_items = len(results)
-        if total_items == 0:
-            return PaginationResult(
-                items=[],
-                start_idx=0,
-                end_idx=0,
-                current_page=1,
-                total_pages=0,
-                total_items=0
-            )
-
-        total_pages = self._calculate_total_pages(total_items)
-        current_page = max(1, min(current_page, total_pages))
-
-        start_idx = (current_page - 1) * self.items_per_page
-        end_idx = min(start_idx + self.items_per_page, total_items)
-
-        page_items = results[start_idx:end_idx]
-
-        return PaginationResult(
-            items=page_items,
-            start_idx=start_idx,
-            end_idx=end_idx,
-            current_page=current_page,
-            total_pages=total_pages,
-            total_items=total_items
-        )
+        total_pages = context.total_pages
+        if total_pages is None:
+            total_pages = self.calculate_total_pages(len(items))
+        return total_pages
 
     def next_page(self, context: ViewContext) -> Tuple[int, str]:
         """
@@ -142,15 +121,14 @@ class NavigationController:
             Tuple of (new_page_number, message_or_empty_string)
         """
         if context.is_viewing_search():
-            total_pages = self._calculate_total_pages(len(context.search_results))
+            total_pages = self._view_total_pages(context, context.search_results)
             if context.current_page < total_pages:
                 return context.current_page + 1, ""
             else:
                 return context.current_page, "Already on the last page."
 
         elif context.is_viewing_messages():
-            messages = context.get_current_messages()
-            total_pages = self._calculate_total_pages(len(messages))
+            total_pages = self._view_total_pages(context, context.get_current_messages())
             if context.current_page < total_pages:
                 return context.current_page + 1, ""
             else:
@@ -194,15 +172,14 @@ class NavigationController:
             Tuple of (new_page_number, message_or_empty_string)
         """
         if context.is_viewing_search():
-            total_pages = self._calculate_total_pages(len(context.search_results))
+            total_pages = self._view_total_pages(context, context.search_results)
             if 1 <= page_num <= total_pages:
                 return page_num, ""
             else:
                 return context.current_page, f"Invalid page number. Must be between 1 and {total_pages}"
 
         elif context.is_viewing_messages():
-            messages = context.get_current_messages()
-            total_pages = self._calculate_total_pages(len(messages))
+            total_pages = self._view_total_pages(context, context.get_current_messages())
             if 1 <= page_num <= total_pages:
                 return page_num, ""
             else:
@@ -210,8 +187,7 @@ class NavigationController:
 
         return context.current_page, "No search results to paginate."
 
-    def _calculate_total_pages(self, total_items: int) -> int:
-        """Calculate total number of pages."""
-        if total_items == 0:
-            return 0
-        return (total_items + self.items_per_page - 1) // self.items_per_page
+    def calculate_total_pages(self, total_items: int) -> int:
+        """Calculate total number of pages (0 when there are no items)."""
+        # Ceiling division
+        return -(-total_items // self.items_per_page)
@@ -2,13 +2,39 @@
 Pagination module for fetching messages from a single channel.
 """
 
-from typing import Dict, Any, List, Optional, Iterator, TYPE_CHECKING
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import BinaryIO, Dict, Any, List, Optional, Iterator, TYPE_CHECKING
 from dataclasses import dataclass
 
+import orjson
+
 if TYPE_CHECKING:
     from ..clients.stream_client import StreamChatClient
 
 
+_CREATED_AT = itemgetter('created_at')
+
+
+def sort_by_created_at(messages: List[Dict[str, Any]]) -> None:
+    """
+    Sort messages in place by created_at, oldest first.
+
+    Uses a C-level itemgetter key; messages without created_at (never seen
+    from the API, but possible in hand-built data) sort first as before.
+
+    Args:
+        messages: Message dictionaries to sort
+    """
+    try:
+        messages.sort(key=_CREATED_AT)
+    except KeyError:
+        messages.sort(key=lambda msg: msg.get('created_at', ''))
+
+
 @dataclass
 class PaginationState:
     """Tracks pagination state for a channel."""
@@ -25,19 +51,101 @@ class ChannelPaginator:
     Handles fetching messages in batches with automatic pagination.
     """
 
-    def __init__(self, client: "StreamChatClient", channel_id: str) -> None:
+    def __init__(
+        self,
+        client: "StreamChatClient",
+        channel_id: str,
+        checkpoint_path: Optional[str] = None
+    ) -> None:
         """
         Initialize the paginator.
 
+        With a checkpoint_path, fetch_all journals every page it receives to
+        that file and deletes it once the fetch completes. If the file is
+        left over from an interrupted fetch, its pages are loaded back: the
+        next fetch_all continues below the last journaled page and returns
+        the journaled messages together with the new ones, without
+        re-fetching them.
+
         Args:
             client: StreamChatClient instance
             channel_id: The channel ID (CID) to paginate (e.g., "community_chat_lounge:9f5dd52...")
+            checkpoint_path: Optional file to journal fetched pages in
         """
         self.client: "StreamChatClient" = client
         self.channel_id: str = channel_id
         self.state: PaginationState = PaginationState(channel_id=channel_id)
         self.all_messages: List[Dict[str, Any]] = []
         self.channel_info: Optional[Dict[str, Any]] = None
+        self.checkpoint_path: Optional[str] = checkpoint_path
+        # Pages (new messages only) fetched but not yet returned, newest first:
+        # restored from the checkpoint, or kept by a fetch_all that raised.
+        # The checkpoint's intact size is None when there is nothing to resume
+        self._resumed_pages: List[List[Dict[str, Any]]] = []
+        self._checkpoint_size: Optional[int] = None
+
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            self._load_checkpoint()
+
+    def _load_checkpoint(self) -> None:
+        """
+        Restore the pages journaled by an interrupted fetch_all.
+
+        The file holds one JSON line naming the channel, then one line per
+        page: {"cursor": ID of its oldest message, "messages": [...]}. A
+        trailing line cut short by the interruption is dropped.
+        """
+        with open(self.checkpoint_path, 'rb') as f:
+            lines = f.readlines()
+
+        try:
+            header = orjson.loads(lines[0]) if lines and lines[0].endswith(b'\n') else None
+        except orjson.JSONDecodeError:
+            header = None
+        # A checkpoint for another channel (or an unreadable one) is ignored
+        if not isinstance(header, dict) or header.get('channel_id') != self.channel_id:
+            return
+
+        size = len(lines[0])
+        for line in lines[1:]:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                break
+            messages = entry['messages']
+            self._resumed_pages.append(messages)
+            self.state.last_message_id = entry['cursor']
+            self.state.total_fetched += len(messages)
+            size += len(line)
+        self._checkpoint_size = size
+
+    def _open_checkpoint(self) -> BinaryIO:
+        """
+        Open the checkpoint for journaling pages.
+
+        A checkpoint that was resumed is continued after its intact part;
+        otherwise a new one is started.
+        """
+        if self._checkpoint_size is not None and os.path.exists(self.checkpoint_path):
+            journal = open(self.checkpoint_path, 'r+b')
+            journal.seek(self._checkpoint_size)
+            journal.truncate()
+            return journal
+
+        journal = open(self.checkpoint_path, 'wb')
+        journal.write(orjson.dumps({'channel_id': self.channel_id}) + b'\n')
+        journal.flush()
+        self._checkpoint_size = journal.tell()
+        return journal
+
+    def _discard_checkpoint(self) -> None:
+        """Delete the checkpoint file (nothing is left to resume)."""
+        self._resumed_pages = []
+        self._checkpoint_size = None
+        if self.checkpoint_path is not None and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
 
     def fetch_page(
         self,
@@ -59,10 +167,12 @@ class ChannelPaginator:
             id_lt = self.state.last_message_id
 
         # Call the query_channel API with pagination support
+        # Once the channel metadata is known, later pages only need the messages
         response = self.client.query_channel(
             channel_id=self.channel_id,
             message_limit=page_size,
-            id_lt=id_lt
+            id_lt=id_lt,
+            minimal=self.channel_info is not None
         )
 
         # Extract channel and messages from the response structure
@@ -94,6 +204,9 @@ class ChannelPaginator:
         """
         Fetch all messages from the channel (or up to max_messages).
 
+        Messages journaled by an interrupted fetch (see checkpoint_path) are
+        included in the result and count towards max_messages.
+
         Args:
             page_size: Number of messages to fetch per request
             max_messages: Maximum total messages to fetch (None = all)
@@ -105,52 +218,111 @@ class ChannelPaginator:
         messages_needed = max_messages
         last_message_id = None
 
-        while self.state.has_more:
-            # Determine how many to fetch this round
-            fetch_size = page_size
-            if messages_needed is not None:
-                fetch_size = min(page_size, messages_needed - len(self.all_messages))
-                if fetch_size <= 0:
-                    break
-
-            # Fetch page
-            response = self.fetch_page(page_size=fetch_size)
-
-            # Extract messages from the query_channel response
-            messages = response.get('messages', [])
-
-            if messages:
-                # Check if we're getting the same messages (no progress)
-                # This happens when we've reached the beginning of history
-                # Since messages are oldest-first, check the first message ID
-                current_first_id = messages[0].get('id')
-                if current_first_id == last_message_id:
-                    # No new messages, we've hit the end
-                    break
-                last_message_id = current_first_id
-
-                self.all_messages.extend(messages)
-
-            # Check if we're done
-            if not self.state.has_more or len(messages) == 0:
-                break
-
-        # Deduplicate by message ID (in case of overlapping fetches)
-        seen_ids = set()
-        unique_messages = []
-        for msg in self.all_messages:
-            msg_id = msg.get('id')
-            if msg_id and msg_id not in seen_ids:
-                seen_ids.add(msg_id)
-                unique_messages.append(msg)
-
-        # Sort messages by created_at timestamp (oldest first)
-        # This ensures consistent ordering regardless of fetch order
-        unique_messages.sort(key=lambda msg: msg.get('created_at', ''))
+        # Deduplicate by message ID (in case of overlapping fetches); each
+        # page's new messages are kept in their own list, in fetch order,
+        # starting with the pages restored from the checkpoint
+        pages: List[List[Dict[str, Any]]] = self._resumed_pages
+        seen_ids = {msg.get('id') for page in pages for msg in page}
+        fetched = sum(len(page) for page in pages)
+
+        def next_fetch_size() -> int:
+            # Determine how many to fetch next round
+            if messages_needed is None:
+                return page_size
+            return min(page_size, messages_needed - fetched)
+
+        journal = self._open_checkpoint() if self.checkpoint_path is not None else None
+        try:
+            # The next page's cursor is known as soon as a page is decoded, so it is
+            # requested in the background while the current page is deduplicated
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = None
+                if self.state.has_more and next_fetch_size() > 0:
+                    future = executor.submit(self.fetch_page, page_size=next_fetch_size())
+
+                while future is not None:
+                    response = future.result()
+                    future = None
+
+                    # Extract messages from the query_channel response
+                    messages = response.get('messages', [])
+
+                    # No messages means we're done
+                    if not messages:
+                        break
+
+                    # Check if we're getting the same messages (no progress)
+                    # This happens when we've reached the beginning of history
+                    # Since messages are oldest-first, check the first message ID
+                    current_first_id = messages[0].get('id')
+                    if current_first_id == last_message_id:
+                        # No new messages, we've hit the end
+                        break
+                    last_message_id = current_first_id
+                    fetched += len(messages)
+
+                    if self.state.has_more and next_fetch_size() > 0:
+                        future = executor.submit(self.fetch_page, page_size=next_fetch_size())
+
+                    page = []
+                    append, mark_seen = page.append, seen_ids.add
+                    for msg in messages:
+                        msg_id = msg.get('id')
+                        if msg_id and msg_id not in seen_ids:
+                            mark_seen(msg_id)
+                            append(msg)
+                    pages.append(page)
+
+                    # Journal the page (one appended line) so an interrupted
+                    # fetch can resume below it with these messages kept
+                    if journal is not None:
+                        journal.write(orjson.dumps({'cursor': current_first_id, 'messages': page}) + b'\n')
+                        journal.flush()
+                        self._checkpoint_size = journal.tell()
+        finally:
+            if journal is not None:
+                journal.close()
+
+        # Pages arrive newest first, each oldest first, so joining them in
+        # reverse gives an (almost always) sorted list; the sort then only has
+        # to confirm the order instead of merging one run per page
+        unique_messages = [msg for page in reversed(pages) for msg in page]
+        sort_by_created_at(unique_messages)
+
+        # The fetch is complete and its messages are returned, so the
+        # checkpoint has nothing left to resume
+        if self.checkpoint_path is not None:
+            self._discard_checkpoint()
+        else:
+            self._resumed_pages = []
 
         self.all_messages = unique_messages
         return self.all_messages
 
+    async def fetch_all_async(
+        self,
+        page_size: int = 30,
+        max_messages: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Awaitable version of fetch_all.
+
+        The client is blocking, so the fetch runs in the event loop's default
+        executor. This lets several channels be fetched concurrently.
+
+        Args:
+            page_size: Number of messages to fetch per request
+            max_messages: Maximum total messages to fetch (None = all)
+
+        Returns:
+            List of all message dictionaries sorted by created_at (oldest first), deduplicated by ID
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(self.fetch_all, page_size=page_size, max_messages=max_messages)
+        )
+
     def fetch_iterator(
         self,
         page_size: int = 30,
@@ -159,6 +331,10 @@ class ChannelPaginator:
         """
         Fetch messages as an iterator, yielding one message at a time.
 
+        While the caller consumes a page, the next page is already being
+        fetched in the background. If iteration stops early, that prefetched
+        page is still fetched and counted in the pagination state.
+
         Args:
             page_size: Number of messages to fetch per request
             max_messages: Maximum total messages to fetch (None = all)
@@ -166,27 +342,32 @@ class ChannelPaginator:
         Yields:
             Individual message dictionaries
         """
+        if not self.state.has_more or (max_messages is not None and max_messages <= 0):
+            return
+
         total_yielded = 0
 
-        while self.state.has_more:
-            # Check if we've reached the limit
-            if max_messages is not None and total_yielded >= max_messages:
-                break
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self.fetch_page, page_size=page_size)
 
-            # Fetch page
-            response = self.fetch_page(page_size=page_size)
+            while future is not None:
+                response = future.result()
+                future = None
 
-            # Extract and yield messages from query_channel response
-            messages = response.get('messages', [])
-            for message in messages:
-                if max_messages is not None and total_yielded >= max_messages:
-                    return
-                yield message
-                total_yielded += 1
+                # Extract messages from query_channel response
+                messages = response.get('messages', [])
 
-            # Check if we're done
-            if not self.state.has_more or len(messages) == 0:
-                break
+                # Prefetch the next page (its cursor is now known) before yielding this one
+                if (self.state.has_more and messages and
+                        (max_messages is None or total_yielded + len(messages) < max_messages)):
+                    future = executor.submit(self.fetch_page, page_size=page_size)
+
+                # Trim the page to the limit once, rather than checking per message
+                if max_messages is not None and len(messages) > max_messages - total_yielded:
+                    messages = messages[:max_messages - total_yielded]
+
+                yield from messages
+                total_yielded += len(messages)
 
     def get_channel_info(self) -> Optional[Dict[str, Any]]:
         """
@@ -201,24 +382,115 @@ class ChannelPaginator:
         """Get current pagination state."""
         return self.state
 
+    @property
+    def cursor(self) -> Optional[str]:
+        """
+        Opaque cursor for the next fetch: the ID of the oldest message fetched so far.
+
+        Passing it to resume_from (possibly on a new paginator, e.g. in a later
+        session) continues with older messages without re-fetching earlier pages.
+        """
+        return self.state.last_message_id
+
+    def resume_from(self, cursor: Optional[str]) -> None:
+        """
+        Continue pagination before a given message.
+
+        Pages held for the previous position (restored from or journaled to
+        the checkpoint) no longer line up with the cursor and are discarded.
+
+        Args:
+            cursor: ID of the oldest message already held (see cursor);
+                None starts again from the newest messages
+        """
+        self._discard_checkpoint()
+        self.state.last_message_id = cursor
+        self.state.has_more = True
+
     def reset(self) -> None:
-        """Reset pagination state."""
+        """Reset pagination state (and delete the checkpoint file, if any)."""
         self.state = PaginationState(channel_id=self.channel_id)
         self.all_messages = []
+        self._discard_checkpoint()
 
 
 class MultiChannelPaginator:
-    """Paginator for multiple channels."""
+    """
+    Paginator for multiple channels.
+
+    Only messages are fetched here; channel metadata should come from the
+    initial get_channels response rather than being re-queried per channel.
+    """
 
-    def __init__(self, client: "StreamChatClient") -> None:
+    def __init__(
+        self,
+        client: "StreamChatClient",
+        max_concurrency: int = 10,
+        channels_data: Optional[Dict[str, Any]] = None
+    ) -> None:
         """
         Initialize the multi-channel paginator.
 
         Args:
             client: StreamChatClient instance
+            max_concurrency: Maximum number of channels fetched at the same time (default: 10)
+            channels_data: Optional get_channels response used to pre-populate channel metadata
         """
         self.client: "StreamChatClient" = client
+        self.max_concurrency: int = max_concurrency
         self.paginators: Dict[str, ChannelPaginator] = {}
+        self._info_cache: Dict[str, Dict[str, Any]] = {}
+
+        if channels_data is not None:
+            self.cache_channel_info(channels_data)
+
+    def cache_channel_info(self, channels_data: Dict[str, Any]) -> None:
+        """
+        Store channel metadata from a get_channels response, keyed by CID.
+
+        Args:
+            channels_data: The JSON response from the get_channels API call
+        """
+        for channel_wrapper in channels_data.get('channels', []):
+            channel = channel_wrapper.get('channel', {})
+            cid = channel.get('cid')
+            if cid:
+                self._info_cache[cid] = channel
+
+    def get_channel_info(self, channel_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get channel metadata without issuing a new request.
+
+        Args:
+            channel_id: The channel ID (CID)
+
+        Returns:
+            Channel metadata dictionary, or None if the channel has not been seen yet
+        """
+        info = self._info_cache.get(channel_id)
+        if info is None and channel_id in self.paginators:
+            info = self.paginators[channel_id].get_channel_info()
+            if info is not None:
+                self._info_cache[channel_id] = info
+        return info
+
+    def prefetch_channel_info(self, channel_ids: List[str]) -> None:
+        """
+        Load metadata for every uncached channel with batched get_channels requests.
+
+        Optional: it costs extra requests, and paginators already receive a
+        channel's metadata with their first page. Worth calling only when the
+        metadata is needed before (or without) fetching messages.
+
+        Args:
+            channel_ids: The channel IDs (CIDs) whose metadata will be needed
+
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+        """
+        missing = [cid for cid in dict.fromkeys(channel_ids) if self.get_channel_info(cid) is None]
+        if missing:
+            self.cache_channel_info(self.client.get_channels_by_cids(missing))
 
     def get_paginator(self, channel_id: str) -> ChannelPaginator:
         """
@@ -231,7 +503,10 @@ class MultiChannelPaginator:
             ChannelPaginator instance for the channel
         """
         if channel_id not in self.paginators:
-            self.paginators[channel_id] = ChannelPaginator(self.client, channel_id)
+            paginator = ChannelPaginator(self.client, channel_id)
+            # Known metadata lets the paginator skip requesting it with the first page
+            paginator.channel_info = self._info_cache.get(channel_id)
+            self.paginators[channel_id] = paginator
         return self.paginators[channel_id]
 
     def fetch_from_channel(
@@ -254,14 +529,17 @@ class MultiChannelPaginator:
         paginator = self.get_paginator(channel_id)
         return paginator.fetch_all(page_size=page_size, max_messages=max_messages)
 
-    def fetch_from_all_channels(
+    async def fetch_from_all_channels_async(
         self,
         channel_ids: List[str],
         page_size: int = 30,
         max_messages_per_channel: Optional[int] = None
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Fetch messages from multiple channels.
+        Fetch messages from multiple channels concurrently.
+
+        At most max_concurrency channels are fetched at once to stay within
+        Stream's rate limits.
 
         Args:
             channel_ids: List of channel IDs to fetch from
@@ -270,13 +548,70 @@ class MultiChannelPaginator:
 
         Returns:
             Dictionary mapping channel_id to list of messages
+
+        Raises:
+            requests.exceptions.RequestException: If fetching any channel fails
         """
+        # Each channel has a single paginator, so never fetch the same channel twice at once
+        unique_ids = list(dict.fromkeys(channel_ids))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch_one(channel_id: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                paginator = self.get_paginator(channel_id)
+                return await paginator.fetch_all_async(
+                    page_size=page_size,
+                    max_messages=max_messages_per_channel
+                )
+
+        responses = await asyncio.gather(
+            *(fetch_one(channel_id) for channel_id in unique_ids),
+            return_exceptions=True
+        )
+
         results = {}
-        for channel_id in channel_ids:
-            messages = self.fetch_from_channel(
-                channel_id=channel_id,
-                page_size=page_size,
-                max_messages=max_messages_per_channel
-            )
-            results[channel_id] = messages
+        for channel_id, response in zip(unique_ids, responses):
+            # Let every fetch finish, then surface the first failure
+            if isinstance(response, BaseException):
+                raise response
+            results[channel_id] = response
         return results
+
+    def fetch_from_all_channels(
+        self,
+        channel_ids: List[str],
+        page_size: int = 30,
+        max_messages_per_channel: Optional[int] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch messages from multiple channels.
+
+        Blocking wrapper around fetch_from_all_channels_async. Called from
+        code that already runs an event loop (a notebook, an async app), it
+        still blocks like a plain call: the coroutine then gets its own loop
+        in a worker thread. Async callers should await
+        fetch_from_all_channels_async instead.
+
+        Args:
+            channel_ids: List of channel IDs to fetch from
+            page_size: Number of messages to fetch per request
+            max_messages_per_channel: Maximum messages per channel
+
+        Returns:
+            Dictionary mapping channel_id to list of messages
+        """
+        run = functools.partial(asyncio.run, self.fetch_from_all_channels_async(
+            channel_ids,
+            page_size=page_size,
+            max_messages_per_channel=max_messages_per_channel
+        ))
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop in this thread: run one here
+            return run()
+
+        # asyncio.run refuses to start inside a running loop
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(run).result()
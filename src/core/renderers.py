@@ -3,17 +3,84 @@ Display renderers for different view types.
 Separates display logic from business logic following Single Responsibility Principle.
 """
 
-from typing import Dict, Any, List
-from datetime import datetime
+import sys
+from typing import Dict, Any, List, NamedTuple, Optional, TextIO
+from datetime import date
 
-from .colors import Colors, print_separator
+from colorama import Fore
+
+from .colors import Colors, StyledWriter, format_separator
 from .search import SearchResult
+from .dates import format_human_date
+
+
+# Visible widths of the channel list columns. Padding is computed from the
+# plain text: str.format widths would count the escape codes as well.
+_INDEX_WIDTH = 5
+_NAME_WIDTH = 37
+_TYPE_WIDTH = 37
+
+
+def _pad(styled: str, text_len: int, width: int) -> str:
+    """Left-align colored text in a column of the given visible width."""
+    return styled + ' ' * (width - text_len)
+
+
+# Column headings of the channel list (static, so colored once)
+_CHANNEL_LIST_HEADER = (
+    f"{_pad(Colors.header('#'), 1, _INDEX_WIDTH)} "
+    f"{_pad(Colors.header('Channel Name'), 12, _NAME_WIDTH)} "
+    f"{_pad(Colors.header('Type'), 4, _TYPE_WIDTH)} "
+    f"{Colors.header('Members')}\n"
+)
+
+# Fixed fragments of the page header and footer, colored once at import
+_PAGE = Colors.info('Page')
+_OF = Colors.info('of')
+_SHOWING = f"{Colors.muted('|')} {Colors.info('Showing')}"
+_MESSAGES_FROM = Colors.header('Messages from:')
+_SEARCH_RESULTS = Colors.header('Search Results:')
+_TOTAL = Colors.info('total')
+_TOTAL_CHANNELS = Colors.success('Total channels:')
+_NAV_HINT = (
+    f"{Colors.muted('Use')} {Colors.command('next')}{Colors.muted(',')} "
+    f"{Colors.command('prev')}{Colors.muted(', or')} {Colors.command('page <num>')} "
+    f"{Colors.muted('to navigate.')}"
+)
+
+
+class _MessageRowFlags(NamedTuple):
+    """Per-row display settings of a message, read from the config once per page."""
+    show_date: bool
+    show_full_text: bool
+    max_text_length: int
+    show_message_id: bool
+
+
+class _SearchRowFlags(NamedTuple):
+    """Per-row display settings of a search result, read from the config once per page."""
+    show_user_name: bool
+    show_user_id: bool
+    show_date: bool
+    show_channel: bool
+    show_matched: bool
+    show_text: bool
+    show_full_text: bool
+    max_text_length: int
+    show_message_id: bool
 
 
 class DisplayConfig:
     """Configuration for display rendering."""
 
+    __slots__ = (
+        '_str_cache', 'show_user_id', 'show_channel_id', 'show_message_id', 'show_date',
+        'show_full_text', 'max_text_length', 'results_per_page', 'visible_fields',
+        '_visible_fields_str',
+    )
+
     def __init__(self):
+        self._str_cache: Optional[str] = None
         self.show_user_id: bool = False
         self.show_channel_id: bool = False
         self.show_message_id: bool = False
@@ -22,10 +89,43 @@ class DisplayConfig:
         self.max_text_length: int = 200
         self.results_per_page: int = 10
         self.visible_fields: set = {'user_name', 'channel_name', 'text', 'date'}
+        self._visible_fields_str: Optional[str] = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute; changing a setting drops the cached __str__ rendering."""
+        object.__setattr__(self, name, value)
+        if not name.startswith('_'):
+            object.__setattr__(self, '_str_cache', None)
+            if name == 'visible_fields':
+                object.__setattr__(self, '_visible_fields_str', None)
+
+    @property
+    def visible_fields_str(self) -> str:
+        """Sorted, comma-separated visible fields (cached until add_field/remove_field)."""
+        if self._visible_fields_str is None:
+            self._visible_fields_str = ', '.join(sorted(self.visible_fields))
+        return self._visible_fields_str
+
+    def add_field(self, field: str) -> None:
+        """Show a field in search results."""
+        self.visible_fields.add(field)
+        self._visible_fields_str = None
+        self._str_cache = None
+
+    def remove_field(self, field: str) -> None:
+        """Hide a field from search results."""
+        self.visible_fields.discard(field)
+        self._visible_fields_str = None
+        self._str_cache = None
 
     def __str__(self) -> str:
-        """Return formatted configuration display."""
-        from colorama import Fore
+        """Return formatted configuration display (cached until a setting changes)."""
+        if self._str_cache is None:
+            self._str_cache = self._render()
+        return self._str_cache
+
+    def _render(self) -> str:
+        """Build the configuration display."""
         separator = Colors.colorize("=" * 80, Fore.CYAN)
 
         lines = []
@@ -39,7 +139,7 @@ class DisplayConfig:
         lines.append(f"{Colors.info('show_full_text:')}     {Colors.value(str(self.show_full_text))}")
         lines.append(f"{Colors.info('max_text_length:')}    {Colors.value(str(self.max_text_length))}")
         lines.append(f"{Colors.info('results_per_page:')}   {Colors.value(str(self.results_per_page))}")
-        lines.append(f"{Colors.info('visible_fields:')}     {Colors.value(', '.join(sorted(self.visible_fields)))}")
+        lines.append(f"{Colors.info('visible_fields:')}     {Colors.value(self.visible_fields_str)}")
         lines.append(separator)
         lines.append("")
         lines.append(f"{Colors.muted('Use')} {Colors.command('set <key> <value>')} {Colors.muted('to change settings')}")
@@ -50,33 +150,22 @@ class DateFormatter:
     """Formats dates in human-friendly format."""
 
     @staticmethod
-    def format_human_date(created_at: str) -> str:
+    def format_human_date(created_at: str, today_ordinal: Optional[int] = None) -> str:
         """
         Format date in human-friendly format (today, yesterday, or date).
 
+        Results are cached per timestamp and day, since the same messages are
+        re-rendered on every page view.
+
         Args:
             created_at: ISO format datetime string
+            today_ordinal: Ordinal of the local date to format relative to;
+                list renderers look it up once per page (default: today)
 
         Returns:
             Human-friendly date string
         """
-        try:
-            dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-            local_dt = dt.astimezone()
-            now = datetime.now(local_dt.tzinfo)
-
-            days_diff = (now.date() - local_dt.date()).days
-
-            if days_diff == 0:
-                return f"Today {local_dt.strftime('%I:%M %p')}"
-            elif days_diff == 1:
-                return f"Yesterday {local_dt.strftime('%I:%M %p')}"
-            elif days_diff < 7:
-                return local_dt.strftime('%a %I:%M %p')
-            else:
-                return local_dt.strftime('%b %d, %I:%M %p')
-        except:
-            return created_at
+        return format_human_date(created_at, today_ordinal)
 
 
 class MessageRenderer:
@@ -86,39 +175,84 @@ class MessageRenderer:
         self.config = config
         self.date_formatter = DateFormatter()
 
-    def render_message(self, msg: Dict[str, Any], index: int) -> None:
+    def render_message(
+        self,
+        msg: Dict[str, Any],
+        index: int,
+        file: Optional[TextIO] = None,
+        today_ordinal: Optional[int] = None
+    ) -> None:
         """
         Render a single message.
 
         Args:
             msg: Message dictionary
             index: Message index number
+            file: Stream to write to (default: sys.stdout)
+            today_ordinal: Ordinal of today's local date (default: looked up)
+        """
+        (file or sys.stdout).write(self.format_message(msg, index, today_ordinal))
+
+    def row_flags(self) -> _MessageRowFlags:
+        """Read the settings format_message needs from the config."""
+        config = self.config
+        return _MessageRowFlags(
+            config.show_date,
+            config.show_full_text,
+            config.max_text_length,
+            config.show_message_id
+        )
+
+    def format_message(
+        self,
+        msg: Dict[str, Any],
+        index: int,
+        today_ordinal: Optional[int] = None,
+        flags: Optional[_MessageRowFlags] = None
+    ) -> str:
+        """
+        Format a single message for display.
+
+        Args:
+            msg: Message dictionary
+            index: Message index number
+            today_ordinal: Ordinal of today's local date (default: looked up)
+            flags: Display settings from row_flags (default: read from the config)
+
+        Returns:
+            The message's lines, followed by a blank line
         """
-        user = msg.get('user', {})
+        show_date, show_full_text, max_text_length, show_message_id = flags or self.row_flags()
+        dim = Colors.DIM
+        get = msg.get
+
+        user = get('user', {})
         user_name = user.get('name', 'Unknown')
-        text = msg.get('text', '')
-        created_at = msg.get('created_at', '')
+        text = get('text', '')
+        created_at = get('created_at', '')
 
         # Format date
         date_str = ''
-        if self.config.show_date and created_at:
-            date_str = self.date_formatter.format_human_date(created_at)
+        if show_date and created_at:
+            date_str = self.date_formatter.format_human_date(created_at, today_ordinal)
 
         # Truncate text
-        if not self.config.show_full_text and len(text) > self.config.max_text_length:
-            text = text[:self.config.max_text_length] + "..."
+        if not show_full_text and len(text) > max_text_length:
+            text = text[:max_text_length] + "..."
 
         # Display: [index] username [date]
-        print(f"{Colors.muted(f'[{index}]')} {Colors.username(user_name)}", end='')
+        line = StyledWriter()
+        line.write(f'[{index}]', dim).write(' ').write(user_name, Colors.BRIGHT_BLUE, bold=True)
         if date_str:
-            print(f" {Colors.muted(f'[{date_str}]')}", end='')
-        print(":")
-        print(f"  {text}")
+            line.write(' ').write(f'[{date_str}]', dim)
+        line.write(':')
 
-        if self.config.show_message_id:
-            print(f"  {Colors.muted('ID:')} {Colors.muted(msg.get('id', 'N/A'))}")
+        lines = [line.getvalue(), f"  {text}"]
+        if show_message_id:
+            lines.append(StyledWriter().write('  ').write(f"ID: {get('id', 'N/A')}", dim).getvalue())
+        lines.append("\n")
 
-        print()
+        return "\n".join(lines)
 
     def render_message_list(
         self,
@@ -128,7 +262,8 @@ class MessageRenderer:
         total_pages: int,
         start_idx: int,
         end_idx: int,
-        total_messages: int
+        total_messages: int,
+        file: Optional[TextIO] = None
     ) -> None:
         """
         Render a paginated list of messages.
@@ -141,21 +276,31 @@ class MessageRenderer:
             start_idx: Starting index (0-based)
             end_idx: Ending index (exclusive)
             total_messages: Total number of messages
+            file: Stream to write to (default: sys.stdout)
         """
-        print()
-        print_separator()
-        print(f"{Colors.header('Messages from:')} {Colors.channel(channel_name)}")
-        print(f"{Colors.info('Page')} {Colors.highlight(str(page))} {Colors.muted('|')} {Colors.info('Showing')} {Colors.value(f'{start_idx + 1}-{end_idx}')} {Colors.info('of')} {Colors.value(str(total_messages))}")
-        print_separator()
-        print()
-
-        # Display messages with correct indices
-        for i, msg in enumerate(messages):
-            actual_index = start_idx + i + 1
-            self.render_message(msg, actual_index)
-
-        print(f"\n{Colors.info('Page')} {Colors.highlight(str(page))} {Colors.info('of')} {Colors.value(str(total_pages))}")
-        print(f"{Colors.muted('Use')} {Colors.command('next')}{Colors.muted(',')} {Colors.command('prev')}{Colors.muted(', or')} {Colors.command('page <num>')} {Colors.muted('to navigate.')}")
+        separator = format_separator()
+        parts = [
+            "\n",
+            separator,
+            f"{_MESSAGES_FROM} {Colors.channel(channel_name)}\n",
+            f"{_PAGE} {Colors.highlight(str(page))} {_SHOWING} {Colors.value(f'{start_idx + 1}-{end_idx}')} {_OF} {Colors.value(str(total_messages))}\n",
+            separator,
+            "\n",
+        ]
+
+        # Display messages with correct indices; every message on the page is
+        # dated relative to the same day and shown with the same settings
+        format_message = self.format_message
+        today_ordinal = date.today().toordinal()
+        flags = self.row_flags()
+        for actual_index, msg in enumerate(messages, start_idx + 1):
+            parts.append(format_message(msg, actual_index, today_ordinal, flags))
+
+        parts.append(f"\n{_PAGE} {Colors.highlight(str(page))} {_OF} {Colors.value(str(total_pages))}\n")
+        parts.append(f"{_NAV_HINT}\n")
+
+        # The whole page goes out in a single write
+        (file or sys.stdout).write("".join(parts))
 
 
 class SearchRenderer:
@@ -165,47 +310,96 @@ class SearchRenderer:
         self.config = config
         self.date_formatter = DateFormatter()
 
-    def render_search_result(self, result: SearchResult, index: int) -> None:
+    def render_search_result(
+        self,
+        result: SearchResult,
+        index: int,
+        file: Optional[TextIO] = None,
+        today_ordinal: Optional[int] = None
+    ) -> None:
         """
         Render a single search result.
 
         Args:
             result: SearchResult object
             index: Result index number
+            file: Stream to write to (default: sys.stdout)
+            today_ordinal: Ordinal of today's local date (default: looked up)
         """
-        fields = self.config.visible_fields
+        (file or sys.stdout).write(self.format_search_result(result, index, today_ordinal))
+
+    def row_flags(self) -> _SearchRowFlags:
+        """Read the settings format_search_result needs from the config."""
+        config = self.config
+        fields = config.visible_fields
+        return _SearchRowFlags(
+            'user_name' in fields,
+            'user_id' in fields and config.show_user_id,
+            'date' in fields and config.show_date,
+            'channel_name' in fields,
+            'matched_field' in fields,
+            'text' in fields,
+            config.show_full_text,
+            config.max_text_length,
+            'message_id' in fields and config.show_message_id
+        )
+
+    def format_search_result(
+        self,
+        result: SearchResult,
+        index: int,
+        today_ordinal: Optional[int] = None,
+        flags: Optional[_SearchRowFlags] = None
+    ) -> str:
+        """
+        Format a single search result for display.
+
+        Args:
+            result: SearchResult object
+            index: Result index number
+            today_ordinal: Ordinal of today's local date (default: looked up)
+            flags: Display settings from row_flags (default: read from the config)
+
+        Returns:
+            The result's lines, followed by a blank line
+        """
+        (show_user_name, show_user_id, show_date, show_channel, show_matched,
+         show_text, show_full_text, max_text_length, show_message_id) = flags or self.row_flags()
+        dim = Colors.DIM
 
         # Display: [index] username [date] in 'channel'
-        print(f"{Colors.muted(f'[{index}]')} ", end='')
+        line = StyledWriter()
+        line.write(f'[{index}]', dim).write(' ')
 
-        if 'user_name' in fields:
-            print(f"{Colors.username(result.user_name)}", end='')
+        if show_user_name:
+            line.write(result.user_name, Colors.BRIGHT_BLUE, bold=True)
 
-        if 'user_id' in fields and self.config.show_user_id:
-            print(f" {Colors.muted(f'(ID: {result.user_id})')}", end='')
+        if show_user_id:
+            line.write(' ').write(f'(ID: {result.user_id})', dim)
 
-        if 'date' in fields and self.config.show_date:
-            print(f" {Colors.muted(f'[{result.format_date()}]')}", end='')
+        if show_date:
+            line.write(' ').write(f'[{result.format_date(today_ordinal)}]', dim)
 
-        if 'channel_name' in fields:
+        if show_channel:
             channel_with_quotes = f"'{result.channel_name}'"
-            print(f" {Colors.info('in')} {Colors.channel(channel_with_quotes)}", end='')
+            line.write(' ').write('in', Colors.CYAN).write(' ').write(channel_with_quotes, Colors.BRIGHT_GREEN, bold=True)
 
-        if 'matched_field' in fields:
-            print(f" {Colors.muted(f'[matched: {result.matched_field}]')}", end='')
+        if show_matched:
+            line.write(' ').write(f'[matched: {result.matched_field}]', dim)
 
-        print(":")  # End line with colon
+        line.write(':')  # End line with colon
 
-        if 'text' in fields:
-            text = result.text
-            if not self.config.show_full_text and len(text) > self.config.max_text_length:
-                text = text[:self.config.max_text_length] + "..."
-            print(f"  {text}")
+        lines = [line.getvalue()]
 
-        if 'message_id' in fields and self.config.show_message_id:
-            print(f"  {Colors.muted('Message ID:')} {Colors.muted(result.message_id)}")
+        if show_text:
+            text = result.text if show_full_text else result.display_text(max_text_length)
+            lines.append(f"  {text}")
 
-        print()
+        if show_message_id:
+            lines.append(StyledWriter().write('  ').write(f'Message ID: {result.message_id}', dim).getvalue())
+
+        lines.append("\n")
+        return "\n".join(lines)
 
     def render_search_results(
         self,
@@ -213,7 +407,8 @@ class SearchRenderer:
         page: int,
         total_pages: int,
         start_idx: int,
-        end_idx: int
+        end_idx: int,
+        file: Optional[TextIO] = None
     ) -> None:
         """
         Render a paginated list of search results.
@@ -224,19 +419,31 @@ class SearchRenderer:
             total_pages: Total number of pages
             start_idx: Starting index (0-based)
             end_idx: Ending index (exclusive)
+            file: Stream to write to (default: sys.stdout)
         """
-        print()
-        print_separator()
-        print(f"{Colors.header('Search Results:')} {Colors.highlight(str(end_idx))} {Colors.info('total')}")
-        print(f"{Colors.info('Page')} {Colors.highlight(str(page))} {Colors.info('of')} {Colors.value(str(total_pages))} {Colors.muted('|')} {Colors.info('Showing')} {Colors.value(f'{start_idx + 1}-{min(end_idx, len(results) + start_idx)}')}")
-        print_separator()
-        print()
-
+        separator = format_separator()
+        parts = [
+            "\n",
+            separator,
+            f"{_SEARCH_RESULTS} {Colors.highlight(str(end_idx))} {_TOTAL}\n",
+            f"{_PAGE} {Colors.highlight(str(page))} {_OF} {Colors.value(str(total_pages))} {_SHOWING} {Colors.value(f'{start_idx + 1}-{min(end_idx, len(results) + start_idx)}')}\n",
+            separator,
+            "\n",
+        ]
+
+        # Every result on the page is dated relative to the same day and shown
+        # with the same settings
+        format_result = self.format_search_result
+        today_ordinal = date.today().toordinal()
+        flags = self.row_flags()
         for idx, result in enumerate(results, start_idx + 1):
-            self.render_search_result(result, idx)
+            parts.append(format_result(result, idx, today_ordinal, flags))
+
+        parts.append(f"\n{_PAGE} {Colors.highlight(str(page))} {_OF} {Colors.value(str(total_pages))}\n")
+        parts.append(f"{_NAV_HINT}\n")
 
-        print(f"\n{Colors.info('Page')} {Colors.highlight(str(page))} {Colors.info('of')} {Colors.value(str(total_pages))}")
-        print(f"{Colors.muted('Use')} {Colors.command('next')}{Colors.muted(',')} {Colors.command('prev')}{Colors.muted(', or')} {Colors.command('page <num>')} {Colors.muted('to navigate.')}")
+        # The whole page goes out in a single write
+        (file or sys.stdout).write("".join(parts))
 
 
 class ChannelRenderer:
@@ -248,56 +455,62 @@ class ChannelRenderer:
         Render a list of channels.
 
         Args:
-            channels: List of channel wrapper dictionaries
+            channels: List of channel dictionaries (already unwrapped from
+                their channel wrappers, see ViewContext.channels)
         """
-        print()
-        print(f"{Colors.header('#'):<5} {Colors.header('Channel Name'):<50} {Colors.header('Type'):<35} {Colors.header('Members'):<10}")
-        print_separator("-")
+        # Color helpers bound once for the row loop
+        value, channel_name, muted, info = Colors.value, Colors.channel, Colors.muted, Colors.info
 
-        for idx, channel_wrapper in enumerate(channels, 1):
-            channel = channel_wrapper.get('channel', {})
+        rows = ["\n", _CHANNEL_LIST_HEADER, format_separator("-")]
+        for idx, channel in enumerate(channels, 1):
             name = channel.get('name', 'Unknown')
             ch_type = channel.get('type', 'unknown')
             member_count = channel.get('member_count', 'N/A')
 
             # Truncate long names
-            if len(name) > 37:
-                name = name[:34] + "..."
+            if len(name) > _NAME_WIDTH:
+                name = name[:_NAME_WIDTH - 3] + "..."
 
-            idx_str = Colors.value(str(idx))
-            name_str = Colors.channel(name)
-            type_str = Colors.muted(ch_type)
-            members_str = Colors.info(str(member_count))
+            idx_text = str(idx)
+            rows.append(
+                f"{_pad(value(idx_text), len(idx_text), _INDEX_WIDTH)} "
+                f"{_pad(channel_name(name), len(name), _NAME_WIDTH)} "
+                f"{_pad(muted(ch_type), len(ch_type), _TYPE_WIDTH)} "
+                f"{info(member_count)}\n"
+            )
 
-            print(f"{idx_str:<14} {name_str:<50} {type_str:<45} {members_str:<20}")
+        rows.append(f"\n{_TOTAL_CHANNELS} {value(len(channels))}\n")
 
-        print(f"\n{Colors.success('Total channels:')} {Colors.value(str(len(channels)))}")
+        # One write for the whole table instead of a print per channel
+        sys.stdout.write("".join(rows))
+        sys.stdout.flush()
 
     @staticmethod
-    def render_channel_details(channel: Dict[str, Any], message_count: int) -> None:
+    def render_channel_details(channel: Dict[str, Any], message_count: int, file: Optional[TextIO] = None) -> None:
         """
         Render detailed information about a channel.
 
         Args:
             channel: Channel dictionary
             message_count: Number of loaded messages
+            file: Stream to write to (default: sys.stdout)
         """
-        print()
-        print_separator()
-        print(Colors.header(f"Channel: {channel.get('name', 'Unknown')}"))
-        print_separator()
-        print(f"{Colors.info('Type:')}          {Colors.value(channel.get('type', 'N/A'))}")
-        print(f"{Colors.info('ID:')}            {Colors.muted(channel.get('id', 'N/A'))}")
-        print(f"{Colors.info('CID:')}           {Colors.muted(channel.get('cid', 'N/A'))}")
-        print(f"{Colors.info('Members:')}       {Colors.highlight(str(channel.get('member_count', 'N/A')))}")
-        print(f"{Colors.info('Campaign ID:')}   {Colors.value(channel.get('campaign_id', 'N/A'))}")
+        print(file=file)
+        print(format_separator(), end='', file=file)
+        print(Colors.header(f"Channel: {channel.get('name', 'Unknown')}"), file=file)
+        print(format_separator(), end='', file=file)
+        print(f"{Colors.info('Type:')}          {Colors.value(channel.get('type', 'N/A'))}", file=file)
+        print(f"{Colors.info('ID:')}            {Colors.muted(channel.get('id', 'N/A'))}", file=file)
+        print(f"{Colors.info('CID:')}           {Colors.muted(channel.get('cid', 'N/A'))}", file=file)
+        print(f"{Colors.info('Members:')}       {Colors.highlight(str(channel.get('member_count', 'N/A')))}", file=file)
+        print(f"{Colors.info('Campaign ID:')}   {Colors.value(channel.get('campaign_id', 'N/A'))}", file=file)
 
         if channel.get('emoji'):
-            print(f"{Colors.info('Emoji:')}         {channel['emoji']}")
+            print(f"{Colors.info('Emoji:')}         {channel['emoji']}", file=file)
 
         if channel.get('last_message_at'):
             date_str = DateFormatter.format_human_date(channel['last_message_at'])
-            print(f"{Colors.info('Last Message:')}  {Colors.date(date_str)}")
+            print(f"{Colors.info('Last Message:')}  {Colors.date(date_str)}", file=file)
 
-        print(f"{Colors.info('Messages:')}      {Colors.success(str(message_count))} loaded")
-        print_separator()
+        print(f"{Colors.info('Messages:')}      {Colors.success(str(message_count))} loaded", file=file)
+        print(format_separator(), end='', file=file)
@@ -3,12 +3,45 @@ Channel Message Search Module
 Provides search functionality for Stream.io chat messages.
 """
 
-from typing import List, Dict, Any, Optional, Literal
-from dataclasses import dataclass
-from datetime import datetime
+import re
+from array import array
+from bisect import bisect_right
+from collections import defaultdict
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Any, Optional, Literal, Iterable, Iterator, Set, Tuple
+from dataclasses import dataclass, field
+from datetime import date
 
+from ._compat import DATACLASS_SLOTS
+from .dates import format_human_date
 
-@dataclass
+
+# Shared default for a missing 'user' entry (read-only; saves building a
+# new empty dict for every lookup)
+_EMPTY: Dict[str, Any] = {}
+
+# Words indexed by MessageSearcher (runs of letters, digits and underscores)
+_TOKEN_RE = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=128)
+def _keyword_terms(keyword: str) -> Tuple[str, ...]:
+    """
+    Split a keyword into the case-folded words looked up in the text index.
+
+    Cached, since the same keywords tend to be searched again during a session.
+
+    Args:
+        keyword: The search keyword as typed
+
+    Returns:
+        The distinct words, longest (most selective) first
+    """
+    return tuple(sorted(set(_TOKEN_RE.findall(keyword.casefold())), key=len, reverse=True))
+
+
+@dataclass(**DATACLASS_SLOTS)
 class SearchResult:
     """Represents a single search result from a message."""
     message_id: str
@@ -19,34 +52,57 @@ class SearchResult:
     channel_name: str
     created_at: str
     matched_field: Literal['text', 'user_name']
+    # Truncated text from the last display_text call, with its max_length
+    _display_text: Optional[Tuple[int, str]] = field(default=None, init=False, repr=False, compare=False)
+    # Formatted date from the last format_date call, with the day it is relative to
+    _formatted_date: Optional[Tuple[int, str]] = field(default=None, init=False, repr=False, compare=False)
 
-    def format_date(self) -> str:
-        """Format the ISO timestamp to a human-readable format."""
-        try:
-            # Parse ISO format: "2025-11-20T20:42:25.971701Z"
-            dt = datetime.fromisoformat(self.created_at.replace('Z', '+00:00'))
-            # Convert to local time
-            local_dt = dt.astimezone()
-            now = datetime.now(local_dt.tzinfo)
-
-            # Calculate days difference
-            days_diff = (now.date() - local_dt.date()).days
-
-            if days_diff == 0:
-                # Today - show time only
-                return f"Today {local_dt.strftime('%I:%M %p')}"
-            elif days_diff == 1:
-                # Yesterday
-                return f"Yesterday {local_dt.strftime('%I:%M %p')}"
-            elif days_diff < 7:
-                # Within last week - show day name
-                return local_dt.strftime('%a %I:%M %p')
-            else:
-                # Older - show date without year
-                return local_dt.strftime('%b %d, %I:%M %p')
-        except (ValueError, AttributeError):
-            # Return original if parsing fails
-            return self.created_at
+    def display_text(self, max_length: int) -> str:
+        """
+        Get the text truncated for display.
+
+        The result is kept on the instance, since a page of results is
+        re-rendered on every navigation.
+
+        Args:
+            max_length: Maximum number of characters before "..." is appended
+
+        Returns:
+            The text, truncated to max_length characters plus "..." if longer
+        """
+        cached = self._display_text
+        if cached is not None and cached[0] == max_length:
+            return cached[1]
+
+        text = self.text
+        if len(text) > max_length:
+            text = text[:max_length] + "..."
+        self._display_text = (max_length, text)
+        return text
+
+    def format_date(self, today_ordinal: Optional[int] = None) -> str:
+        """
+        Format the ISO timestamp to a human-readable format.
+
+        The result is kept on the instance until the day changes, so redrawing
+        a page neither parses the timestamp nor consults the shared date cache.
+
+        Args:
+            today_ordinal: Ordinal of the local date to format relative to
+                (default: today)
+
+        Returns:
+            Human-friendly date string (see format_human_date)
+        """
+        if today_ordinal is None:
+            today_ordinal = date.today().toordinal()
+        cached = self._formatted_date
+        if cached is not None and cached[0] == today_ordinal:
+            return cached[1]
+
+        formatted = format_human_date(self.created_at, today_ordinal)
+        self._formatted_date = (today_ordinal, formatted)
+        return formatted
 
     def __str__(self) -> str:
         """Format the search result for display."""
@@ -57,6 +113,224 @@ class SearchResult:
         )
 
 
+class _ChannelIndex:
+    """
+    Search index over the messages of a single channel.
+
+    Messages are extracted once into parallel lists (one entry per message,
+    addressed by a local ID in channel order) so searches never walk the
+    nested channel data again. The lists reference the strings already held
+    by channels_data, so the messages are not copied. The text index maps
+    every case-folded word to the IDs of messages that contain it; the user
+    index maps each user name to its message IDs.
+
+    The text index is packed into one array of message IDs (self.postings)
+    where word i owns the slice between self.posting_offsets[i] and
+    self.posting_offsets[i + 1]. Most words occur in only a few messages, so
+    this avoids keeping a separate container per word.
+    """
+
+    def __init__(self, channel_wrapper: Dict[str, Any]) -> None:
+        """
+        Index one channel.
+
+        Args:
+            channel_wrapper: A channel entry from the get_channels response
+        """
+        channel = channel_wrapper.get('channel', {})
+        self.channel_id: str = channel.get('id', 'unknown')
+        self.channel_name: str = channel.get('name', 'Unknown Channel')
+
+        self.texts: List[str] = []
+        self.user_names: List[str] = []
+        self.msg_refs: List[Dict[str, Any]] = []
+        index: Dict[str, List[int]] = defaultdict(list)
+        self.user_index: Dict[str, array] = defaultdict(lambda: array('I'))
+        self._user_lower: Dict[str, str] = {}
+        self._vocab_blob: Optional[str] = None
+        self._corpora: Dict[bool, Tuple[str, array]] = {}
+        texts_lower: List[str] = []
+
+        # Bind the methods used per message to locals once
+        get = dict.get
+        find_tokens = _TOKEN_RE.findall
+        user_lower = self._user_lower
+        user_index = self.user_index
+        append_text = self.texts.append
+        append_text_lower = texts_lower.append
+        append_user_name = self.user_names.append
+        append_msg_ref = self.msg_refs.append
+
+        for local_id, message in enumerate(channel_wrapper.get('messages', [])):
+            text = get(message, 'text', '')
+            user_name = get(get(message, 'user', _EMPTY), 'name', 'Unknown User')
+            if user_name not in user_lower:
+                user_lower[user_name] = user_name.lower()
+
+            append_text(text)
+            append_text_lower(text.lower())
+            append_user_name(user_name)
+            append_msg_ref(message)
+
+            for token in set(find_tokens(text.casefold())):
+                index[token].append(local_id)
+            user_index[user_name].append(local_id)
+
+        self._vocab_tokens: List[str] = list(index)
+        self.postings: array = array('I')
+        self.posting_offsets: array = array('I', [0])
+        for local_ids in index.values():
+            self.postings.extend(local_ids)
+            self.posting_offsets.append(len(self.postings))
+
+        # Lowercase once at ingest so case-insensitive searches never have to
+        self._corpora[False] = self._join_corpus(texts_lower)
+
+    def _build_vocabulary(self) -> None:
+        """
+        Concatenate all indexed words into one newline-separated string.
+
+        Words never contain a newline, so a match inside the blob always lies
+        within a single word. self._vocab_offsets holds the start of each word.
+        """
+        self._vocab_offsets: array = array('I')
+        position = 0
+        for token in self._vocab_tokens:
+            self._vocab_offsets.append(position)
+            position += len(token) + 1
+        self._vocab_blob = '\n'.join(self._vocab_tokens)
+
+    def _build_corpus(self, case_sensitive: bool) -> Tuple[str, array]:
+        """
+        Concatenate all message texts into one NUL-separated string.
+
+        Args:
+            case_sensitive: Keep the original case (otherwise texts are lowercased)
+
+        Returns:
+            Tuple of (corpus, start offset of each message in the corpus). The
+            offsets end with one extra entry past the last message, so message
+            i always spans offsets[i] to offsets[i + 1] - 1.
+        """
+        return self._join_corpus(self.texts if case_sensitive else [text.lower() for text in self.texts])
+
+    @staticmethod
+    def _join_corpus(texts: List[str]) -> Tuple[str, array]:
+        """
+        Join texts with NUL separators and record where each one starts.
+
+        Args:
+            texts: Message texts in local ID order
+
+        Returns:
+            Tuple of (corpus, offsets) as described in _build_corpus
+        """
+        offsets = array('I')
+        position = 0
+        for text in texts:
+            offsets.append(position)
+            position += len(text) + 1
+        offsets.append(position)
+        return '\0'.join(texts), offsets
+
+    def corpus(self, case_sensitive: bool) -> Tuple[str, array]:
+        """
+        Get the concatenated message texts, building them on first use.
+
+        Args:
+            case_sensitive: Keep the original case (otherwise texts are lowercased)
+
+        Returns:
+            Tuple of (corpus, offsets) as described in _build_corpus
+        """
+        corpus = self._corpora.get(case_sensitive)
+        if corpus is None:
+            corpus = self._corpora[case_sensitive] = self._build_corpus(case_sensitive)
+        return corpus
+
+    def corpus_candidates(self, search_keyword: str, case_sensitive: bool) -> Iterable[int]:
+        """
+        Get IDs of messages whose text contains the keyword by scanning the whole corpus.
+
+        Used for keywords the word index cannot narrow down (no word
+        characters); one str.find pass over the concatenated texts replaces a
+        substring check per message.
+
+        Args:
+            search_keyword: The keyword, already lowercased unless case_sensitive
+            case_sensitive: Whether the search should be case-sensitive
+
+        Returns:
+            Iterable of message IDs (a superset of the actual matches)
+        """
+        blob, offsets = self.corpus(case_sensitive)
+
+        candidates = []
+        position = blob.find(search_keyword)
+        while position != -1:
+            local_id = bisect_right(offsets, position) - 1
+            candidates.append(local_id)
+            # Continue with the next message; this one is already a candidate
+            position = blob.find(search_keyword, offsets[local_id + 1])
+        return candidates
+
+    def text_candidates(self, terms: Iterable[str]) -> Iterable[int]:
+        """
+        Get IDs of messages whose text may contain all the given words.
+
+        Every word of the keyword has to appear inside a single indexed word,
+        so only the vocabulary is scanned instead of every message text. Each
+        word is located with str.find over the concatenated vocabulary.
+
+        Args:
+            terms: The case-folded words of the keyword, longest first (a match
+                in either case mode implies a match between the case-folded strings)
+
+        Returns:
+            Iterable of message IDs (a superset of the actual matches)
+        """
+        if self._vocab_blob is None:
+            self._build_vocabulary()
+        blob = self._vocab_blob
+        offsets = self._vocab_offsets
+        packed = self.postings
+        posting_offsets = self.posting_offsets
+
+        candidates: Optional[set] = None
+        for term in terms:
+            postings = set()
+            position = blob.find(term)
+            while position != -1:
+                token_idx = bisect_right(offsets, position) - 1
+                postings.update(packed[posting_offsets[token_idx]:posting_offsets[token_idx + 1]])
+                # Continue with the next word; this one is already counted
+                next_token = token_idx + 1
+                if next_token == len(offsets):
+                    break
+                position = blob.find(term, offsets[next_token])
+            candidates = postings if candidates is None else candidates & postings
+            if not candidates:
+                break
+        return candidates
+
+    def matching_users(self, search_keyword: str, case_sensitive: bool) -> Set[str]:
+        """
+        Get the author names that contain the keyword.
+
+        Each distinct author is checked once, however many messages they posted.
+
+        Args:
+            search_keyword: The keyword, already lowercased unless case_sensitive
+            case_sensitive: Whether the search should be case-sensitive
+
+        Returns:
+            Set of matching user names
+        """
+        if case_sensitive:
+            return {user_name for user_name in self.user_index if search_keyword in user_name}
+        return {user_name for user_name, user_lower in self._user_lower.items() if search_keyword in user_lower}
+
+
 class MessageSearcher:
     """Search through channel messages for keywords."""
 
@@ -69,6 +343,148 @@ class MessageSearcher:
         """
         self.channels_data: Dict[str, Any] = channels_data
         self.channels: List[Dict[str, Any]] = channels_data.get('channels', [])
+        self._build_index()
+
+    def _build_index(self) -> None:
+        """
+        Index every channel separately.
+
+        Keeping one index per channel lets a channel whose messages changed be
+        re-indexed on its own (see update_channel).
+        """
+        self._segments: List[_ChannelIndex] = [
+            _ChannelIndex(channel_wrapper) for channel_wrapper in self.channels
+        ]
+        self._total_messages: Optional[int] = None
+
+    def update_channel(self, channel_index: int) -> None:
+        """
+        Re-index a single channel after its messages changed.
+
+        Only that channel's messages are scanned; every other channel keeps its
+        existing index.
+
+        Args:
+            channel_index: Position of the channel in channels_data['channels']
+        """
+        self._segments[channel_index] = _ChannelIndex(self.channels[channel_index])
+        self._total_messages = None
+
+    def replace_channel(self, channel_index: int, messages: List[Dict[str, Any]]) -> None:
+        """
+        Replace a channel's messages and re-index only that channel.
+
+        Args:
+            channel_index: Position of the channel in channels_data['channels']
+            messages: The channel's complete new message list
+        """
+        self.channels[channel_index]['messages'] = messages
+        self.update_channel(channel_index)
+
+    def _iter_matches(
+        self,
+        keyword: str,
+        search_text: bool,
+        search_usernames: bool,
+        case_sensitive: bool
+    ) -> Iterator[Tuple[_ChannelIndex, int, str]]:
+        """
+        Yield matching messages lazily, channel by channel in message order.
+
+        Matches are yielded as (segment, local ID, matched field) so callers
+        can skip past them without building SearchResult objects.
+
+        Args:
+            keyword: The keyword to search for (must not be empty)
+            search_text: Whether to search in message text
+            search_usernames: Whether to search in usernames
+            case_sensitive: Whether the search should be case-sensitive
+
+        Yields:
+            Tuple of (channel index, local message ID, matched field)
+        """
+        # Prepare keyword for comparison
+        search_keyword = keyword if case_sensitive else keyword.lower()
+        # Words to look up in the text index, longest (most selective) first
+        terms = _keyword_terms(keyword)
+
+        for segment in self._segments:
+            # Author names are matched once per distinct user; their messages
+            # are then found through the user index
+            matching_users: Set[str] = set()
+            user_ids = set()
+            if search_usernames:
+                matching_users = segment.matching_users(search_keyword, case_sensitive)
+                user_index = segment.user_index
+                for user_name in matching_users:
+                    user_ids.update(user_index[user_name])
+
+            if not search_text:
+                # Username-only search: every candidate is already a match
+                for local_id in sorted(user_ids):
+                    yield segment, local_id, 'user_name'
+                continue
+
+            # Narrow down to candidate messages using the indexes
+            if terms:
+                candidates = set(segment.text_candidates(terms))
+            else:
+                # Punctuation-only keyword: fall back to scanning every message text
+                candidates = set(segment.corpus_candidates(search_keyword, case_sensitive))
+            candidates |= user_ids
+
+            # Verify candidates in their original message order
+            texts = segment.texts
+            user_names = segment.user_names
+            if not case_sensitive:
+                # Check texts inside the lowercased corpus: a bounded str.find
+                # per message instead of lowercasing each text on every search
+                lower_blob, lower_offsets = segment.corpus(False)
+            for local_id in sorted(candidates):
+                if (
+                    search_keyword in texts[local_id] if case_sensitive
+                    else lower_blob.find(search_keyword, lower_offsets[local_id], lower_offsets[local_id + 1] - 1) != -1
+                ):
+                    yield segment, local_id, 'text'
+                elif user_names[local_id] in matching_users:
+                    yield segment, local_id, 'user_name'
+
+    @staticmethod
+    def _make_result(segment: _ChannelIndex, local_id: int, matched_field: str) -> SearchResult:
+        """Build the SearchResult for one match (only matches go back to the message dict)."""
+        message = segment.msg_refs[local_id]
+        return SearchResult(
+            message_id=message.get('id', ''),
+            text=segment.texts[local_id],
+            user_id=message.get('user', _EMPTY).get('id', 'unknown'),
+            user_name=segment.user_names[local_id],
+            channel_id=segment.channel_id,
+            channel_name=segment.channel_name,
+            created_at=message.get('created_at', ''),
+            matched_field=matched_field
+        )
+
+    def iter_search(
+        self,
+        keyword: str,
+        search_text: bool = True,
+        search_usernames: bool = True,
+        case_sensitive: bool = False
+    ) -> Iterator[SearchResult]:
+        """
+        Search lazily, yielding results as they are found.
+
+        Takes the same arguments as search; stopping early skips the rest of
+        the search.
+
+        Yields:
+            SearchResult objects matching the criteria
+        """
+        if not keyword:
+            return
+        make_result = self._make_result
+        for match in self._iter_matches(keyword, search_text, search_usernames, case_sensitive):
+            yield make_result(*match)
 
     def search(
         self,
@@ -96,61 +512,17 @@ class MessageSearcher:
         if not keyword:
             return []
 
-        # Prepare keyword for comparison
-        search_keyword = keyword if case_sensitive else keyword.lower()
+        if page_size is None:
+            return list(self.iter_search(keyword, search_text, search_usernames, case_sensitive))
+        if page_size <= 0 or page < 1:
+            return []
 
-        results = []
-
-        # Iterate through all channels
-        for channel_wrapper in self.channels:
-            channel = channel_wrapper.get('channel', {})
-            channel_id = channel.get('id', 'unknown')
-            channel_name = channel.get('name', 'Unknown Channel')
-            messages = channel_wrapper.get('messages', [])
-
-            # Search through messages in this channel
-            for message in messages:
-                message_id = message.get('id', '')
-                text = message.get('text', '')
-                user = message.get('user', {})
-                user_id = user.get('id', 'unknown')
-                user_name = user.get('name', 'Unknown User')
-                created_at = message.get('created_at', '')
-
-                # Prepare fields for comparison
-                compare_text = text if case_sensitive else text.lower()
-                compare_username = user_name if case_sensitive else user_name.lower()
-
-                # Check for matches
-                matched = False
-                matched_field = None
-
-                if search_text and search_keyword in compare_text:
-                    matched = True
-                    matched_field = 'text'
-                elif search_usernames and search_keyword in compare_username:
-                    matched = True
-                    matched_field = 'user_name'
-
-                if matched:
-                    results.append(SearchResult(
-                        message_id=message_id,
-                        text=text,
-                        user_id=user_id,
-                        user_name=user_name,
-                        channel_id=channel_id,
-                        channel_name=channel_name,
-                        created_at=created_at,
-                        matched_field=matched_field
-                    ))
-
-        # Apply pagination if requested
-        if page_size is not None:
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            results = results[start_idx:end_idx]
-
-        return results
+        # Only matches inside the requested page become SearchResult objects;
+        # earlier ones are just skipped, and the search stops once it is full
+        start_idx = (page - 1) * page_size
+        matches = self._iter_matches(keyword, search_text, search_usernames, case_sensitive)
+        make_result = self._make_result
+        return [make_result(*match) for match in islice(matches, start_idx, start_idx + page_size)]
 
     def search_by_user(self, username: str, case_sensitive: bool = False) -> List[SearchResult]:
         """
@@ -163,20 +535,18 @@ class MessageSearcher:
         Returns:
             List of SearchResult objects from that user
         """
-        return self.search(
-            keyword=username,
-            search_text=False,
-            search_usernames=True,
-            case_sensitive=case_sensitive
-        )
+        return list(self.iter_search(username, False, True, case_sensitive))
 
     def get_total_message_count(self) -> int:
-        """Get the total number of messages across all channels."""
-        count = 0
-        for channel_wrapper in self.channels:
-            messages = channel_wrapper.get('messages', [])
-            count += len(messages)
-        return count
+        """
+        Get the total number of messages across all channels.
+
+        The count is kept until a channel is re-indexed (every change to the
+        indexed messages goes through update_channel).
+        """
+        if self._total_messages is None:
+            self._total_messages = sum(len(segment.texts) for segment in self._segments)
+        return self._total_messages
 
     def get_channel_count(self) -> int:
         """Get the total number of channels."""
@@ -4,9 +4,10 @@ Manages the current view state without coupling to specific display implementati
 """
 
 from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
+from ._compat import DATACLASS_SLOTS
 from .search import SearchResult
 
 
@@ -17,7 +18,61 @@ class ViewMode(Enum):
     SEARCH_RESULTS = "search_results"
 
 
-@dataclass
+class _TrieNode:
+    """Node of a channel-name prefix trie."""
+
+    __slots__ = ('children', 'indices')
+
+    def __init__(self) -> None:
+        self.children: Dict[str, '_TrieNode'] = {}
+        # Every channel whose name starts with the path to this node
+        self.indices: List[int] = []
+
+
+class ChannelNameTrie:
+    """
+    Prefix trie over lowercased channel names.
+
+    Each node keeps the indices of all channels below it, so a prefix lookup
+    is a walk of len(prefix) steps regardless of how many channels exist.
+    """
+
+    def __init__(self, names: List[str]) -> None:
+        """
+        Build the trie.
+
+        Args:
+            names: Lowercased channel names, in channel order
+        """
+        self._root = _TrieNode()
+        for index, name in enumerate(names):
+            node = self._root
+            for char in name:
+                child = node.children.get(char)
+                if child is None:
+                    child = node.children[char] = _TrieNode()
+                node = child
+                node.indices.append(index)
+
+    def find_prefix(self, prefix: str) -> List[int]:
+        """
+        Get the channels whose name starts with a prefix.
+
+        Args:
+            prefix: Lowercased, non-empty prefix
+
+        Returns:
+            Channel indices in channel order (empty if none match)
+        """
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.indices
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ViewContext:
     """
     Manages the current view state of the CLI.
@@ -38,20 +93,73 @@ class ViewContext:
     # Pagination context
     current_page: int = 1
     messages_viewed: bool = False  # Track if messages have been viewed for current channel
+    # Page count of the last rendered view; None whenever it may be stale
+    total_pages: Optional[int] = None
+
+    # Channel dicts unwrapped from channels_data, plus their lowercased names;
+    # the channel list itself never changes after loading (only messages do)
+    channels: List[Dict[str, Any]] = field(default_factory=list, init=False, repr=False)
+    channel_names_lower: List[str] = field(default_factory=list, init=False, repr=False)
+    # Per-channel columns read on every command, parallel to channels
+    channel_names: List[str] = field(default_factory=list, init=False, repr=False)
+    channel_cids: List[Optional[str]] = field(default_factory=list, init=False, repr=False)
+    channel_messages: List[List[Dict[str, Any]]] = field(default_factory=list, init=False, repr=False)
+    _name_to_index: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _name_trie: Optional[ChannelNameTrie] = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
-        """Initialize mutable defaults."""
+        """Initialize mutable defaults and the unwrapped channel list."""
         if self.search_results is None:
             self.search_results = []
         if self.channels_data is None:
             self.channels_data = {'channels': []}
 
+        wrappers = self.channels_data.get('channels', [])
+        self.channels = [channel_wrapper.get('channel') or {} for channel_wrapper in wrappers]
+        self.channel_names = [channel.get('name', 'Unknown') for channel in self.channels]
+        self.channel_cids = [channel.get('cid') for channel in self.channels]
+        self.channel_messages = [channel_wrapper.get('messages', []) for channel_wrapper in wrappers]
+        self.channel_names_lower = [channel.get('name', '').lower() for channel in self.channels]
+        for index, name in enumerate(self.channel_names_lower):
+            self._name_to_index.setdefault(name, index)
+        self._name_trie = ChannelNameTrie(self.channel_names_lower)
+
+    def find_channels(self, search_name: str) -> List[int]:
+        """
+        Find channels by name.
+
+        An exact name wins; otherwise every channel whose name starts with
+        search_name is returned; failing that, the first channel whose name
+        contains it.
+
+        Args:
+            search_name: Lowercased name or part of a name
+
+        Returns:
+            Matching channel indices (empty if nothing matches)
+        """
+        index = self._name_to_index.get(search_name)
+        if index is not None:
+            return [index]
+
+        if search_name:
+            matches = self._name_trie.find_prefix(search_name)
+            if matches:
+                return list(matches)
+
+        index = next(
+            (i for i, name in enumerate(self.channel_names_lower) if search_name in name),
+            None
+        )
+        return [] if index is None else [index]
+
     def select_channel(self, channel: Dict[str, Any], index: int) -> None:
         """Select a channel and switch to messages view."""
         self.current_channel = channel
         self.current_channel_index = index
         self.mode = ViewMode.CHANNEL_LIST  # Don't auto-switch to MESSAGES mode
         self.current_page = 1
+        self.total_pages = None
         self.search_results = []
         self.messages_viewed = False  # Reset when changing channels
 
@@ -60,10 +168,12 @@ class ViewContext:
         self.search_results = results
         self.mode = ViewMode.SEARCH_RESULTS
         self.current_page = 1
+        self.total_pages = None
 
     def clear_search(self) -> None:
         """Clear search results and return to previous view."""
         self.search_results = []
+        self.total_pages = None
         if self.current_channel:
             self.mode = ViewMode.MESSAGES
         else:
@@ -71,23 +181,26 @@ class ViewContext:
 
     def get_current_messages(self) -> List[Dict[str, Any]]:
         """Get messages from the current channel."""
-        if not self.current_channel or not self.channels_data:
-            return []
-
-        channels = self.channels_data.get('channels', [])
-        if self.current_channel_index >= len(channels):
+        if not self.current_channel or self.current_channel_index >= len(self.channel_messages):
             return []
 
-        return channels[self.current_channel_index].get('messages', [])
+        return self.channel_messages[self.current_channel_index]
 
     def update_channel_messages(self, messages: List[Dict[str, Any]]) -> None:
-        """Update messages for the current channel."""
+        """
+        Update messages for the current channel.
+
+        Messages are expected oldest first (sorted by created_at), the order the
+        API returns them in; cmd_fetch_more relies on this to find the oldest one.
+        """
         if not self.channels_data or self.current_channel_index < 0:
             return
 
         channels = self.channels_data.get('channels', [])
         if self.current_channel_index < len(channels):
             channels[self.current_channel_index]['messages'] = messages
+            self.channel_messages[self.current_channel_index] = messages
+            self.total_pages = None
 
     def is_viewing_messages(self) -> bool:
         """Check if currently viewing messages."""